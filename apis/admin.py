@@ -0,0 +1,40 @@
+# apis/admin.py
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+from typing import Dict, Any
+from utils.profiler import cycle_profiler
+from apis.models import ProfilingStart
+
+router = APIRouter()
+
+
+@router.get("/admin/profiling")
+async def get_profiling_status() -> Dict[str, Any]:
+    """프로파일링 상태와 저장된 프로파일 목록을 반환합니다."""
+    return {**cycle_profiler.status(), 'profiles': cycle_profiler.list_profiles()}
+
+
+@router.post("/admin/profiling", status_code=202)
+async def start_profiling(request: ProfilingStart) -> Dict[str, Any]:
+    """다음 N번의 폴링 사이클 또는 지정한 시간 동안 프로파일링을 시작합니다."""
+    try:
+        cycle_profiler.start(request.mode, cycles=request.cycles, duration=request.duration)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return cycle_profiler.status()
+
+
+@router.delete("/admin/profiling")
+async def stop_profiling() -> Dict[str, Any]:
+    """진행 중인 프로파일링을 중단합니다."""
+    cycle_profiler.stop()
+    return cycle_profiler.status()
+
+
+@router.get("/admin/profiling/{name}")
+async def download_profile(name: str):
+    """저장된 프로파일 파일을 다운로드합니다."""
+    path = cycle_profiler.get_profile_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, filename=name)
@@ -0,0 +1,103 @@
+# apis/cache.py
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Tuple
+from fastapi import Request, Response
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    next_cursor: Optional[str] = None
+
+
+class ResponseCache:
+    """직렬화된 목록 응답을 메모리에 보관하는 캐시입니다.
+
+    쓰기 엔드포인트에서 namespace 단위로 invalidate()를 호출해 무효화합니다.
+    폴링 사이클의 작업 스레드에서도 무효화하므로 lock으로 보호합니다.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Hashable], CachedResponse]" = OrderedDict()
+        # namespace별 무효화 횟수 (응답 생성 중에 무효화된 경우 저장하지 않기 위함)
+        self._generations: Dict[str, int] = {}
+
+    def get(self, namespace: str, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is not None:
+                self._entries.move_to_end((namespace, key))
+            return entry
+
+    def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    def set(self, namespace: str, key: Hashable, entry: CachedResponse, generation: Optional[int] = None):
+        """응답을 저장합니다. generation이 주어지고 그 뒤 무효화된 경우에는 저장하지 않습니다."""
+        with self._lock:
+            if generation is not None and generation != self.generation(namespace):
+                return
+            self._entries[(namespace, key)] = entry
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, namespace: str):
+        """해당 namespace의 캐시 항목을 모두 제거합니다."""
+        with self._lock:
+            self._generations[namespace] = self.generation(namespace) + 1
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[cache_key]
+
+
+response_cache = ResponseCache()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    candidates = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+    return etag in candidates
+
+
+def cached_json_response(
+    request: Request,
+    namespace: str,
+    key: Hashable,
+    build: Callable[[], Tuple[bytes, Optional[str]]]
+) -> Response:
+    """캐시된 JSON 응답을 반환하고, 없으면 build()로 생성해 캐시에 저장합니다.
+
+    Args:
+        request: ETag 비교를 위한 요청 객체
+        namespace: 무효화 단위 ('channels', 'webhooks' 등)
+        key: namespace 내 캐시 키 (쿼리 파라미터 조합)
+        build: (JSON 본문, 다음 페이지 커서)를 반환하는 함수
+
+    Returns:
+        Response: If-None-Match가 일치하면 304, 아니면 200 JSON 응답
+    """
+    entry = response_cache.get(namespace, key)
+    if entry is None:
+        generation = response_cache.generation(namespace)
+        body, next_cursor = build()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        entry = CachedResponse(body=body, etag=etag, next_cursor=next_cursor)
+        response_cache.set(namespace, key, entry, generation)
+
+    headers = {'ETag': entry.etag, 'Cache-Control': 'no-cache'}
+    if entry.next_cursor is not None:
+        headers['X-Next-Cursor'] = entry.next_cursor
+
+    if _etag_matches(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type='application/json', headers=headers)
@@ -1,14 +1,22 @@
 # apis/channel.py
-from fastapi import APIRouter, HTTPException
-from typing import List
+from dataclasses import asdict
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import TypeAdapter
+from typing import List, Optional
 from utils.db_manager import DatabaseManager
 from utils.config import Config
+from utils.status_tracker import status_tracker
+from utils.circuit_breaker import circuit_breakers, CHANNEL
+from utils.channel_registry import channel_registry
+from apis.cache import cached_json_response, response_cache
 from apis.models import ChannelCreate, ChannelResponse
 
 router = APIRouter()
 db = DatabaseManager()
 youtube_api = Config.YOUTUBE_API
 
+channel_list_adapter = TypeAdapter(List[ChannelResponse])
+
 @router.post("/channels", response_model=ChannelResponse, status_code=201)
 async def create_channel(channel: ChannelCreate):
     """핸들링 ID와 웹훅 ID로 새로운 채널을 등록합니다."""
@@ -34,6 +42,8 @@ async def create_channel(channel: ChannelCreate):
                 status_code=400,
                 detail=f"Failed to get YouTube channel info: {str(e)}"
             )
+        finally:
+            status_tracker.update_quota(youtube_api.get_daily_quota_used())
 
         # 채널 등록
         channel_id = db.add_channel(
@@ -43,9 +53,12 @@ async def create_channel(channel: ChannelCreate):
             yt_ch_name=channel_info['channel_name']
         )
 
+        response_cache.invalidate('channels')
+
         created_channel = db.get_channel_by_id(channel_id)
         if created_channel is None:
             raise HTTPException(status_code=500, detail="Failed to create channel")
+        channel_registry.add(created_channel)
         return created_channel
 
     except HTTPException:
@@ -54,17 +67,45 @@ async def create_channel(channel: ChannelCreate):
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/channels", response_model=List[ChannelResponse])
-async def list_channels():
-    """등록된 모든 채널 목록을 조회합니다."""
+async def list_channels(
+    request: Request,
+    cursor: Optional[int] = Query(None, ge=0, description="이전 페이지의 X-Next-Cursor 값"),
+    limit: int = Query(100, ge=1, le=500),
+    webhook_id: Optional[int] = Query(None),
+    name: Optional[str] = Query(None, max_length=100, description="채널 이름/핸들링 ID 검색어")
+):
+    """등록된 채널 목록을 페이지 단위로 조회합니다.
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
+    """
+    def build():
+        channels = db.get_channels_page(
+            after_id=cursor or 0,
+            limit=limit + 1,
+            webhook_id=webhook_id,
+            name=name
+        )
+        next_cursor = str(channels[limit - 1].id) if len(channels) > limit else None
+        body = channel_list_adapter.dump_json(
+            channel_list_adapter.validate_python([asdict(ch) for ch in channels[:limit]])
+        )
+        return body, next_cursor
+
     try:
-        channels = db.get_all_channels()
-        return channels
+        return cached_json_response(
+            request, 'channels', (cursor, limit, webhook_id, name), build
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve channels: {str(e)}")
 
 @router.delete("/channels/{channel_id}", status_code=204)
 async def delete_channel(channel_id: int):
     """채널을 삭제합니다."""
+    channel = db.get_channel_by_id(channel_id)
     success = db.delete_channel(channel_id)
     if not success:
-        raise HTTPException(status_code=404, detail="Channel not found")
\ No newline at end of file
+        raise HTTPException(status_code=404, detail="Channel not found")
+    channel_registry.remove(channel_id)
+    response_cache.invalidate('channels')
+    if channel and db.get_channel_by_yt_channel_id(channel.yt_channel_id) is None:
+        circuit_breakers.reset(CHANNEL, channel.yt_channel_id)
\ No newline at end of file
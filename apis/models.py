@@ -1,6 +1,7 @@
 # apis/models.py
-from pydantic import BaseModel, HttpUrl, constr
+from pydantic import BaseModel, HttpUrl, conint, constr
 from datetime import datetime
+from typing import Literal, Optional
 
 # 웹훅 모델
 class WebhookCreate(BaseModel):
@@ -27,5 +28,12 @@ class ChannelResponse(BaseModel):
     yt_channel_id: str
     yt_handling_id: str
     yt_ch_name: str
+    status: str = 'active'
     create_at: datetime
-    update_at: datetime
\ No newline at end of file
+    update_at: datetime
+
+# 프로파일링 모델
+class ProfilingStart(BaseModel):
+    mode: Literal['deterministic', 'sampling'] = 'sampling'
+    cycles: Optional[conint(ge=1, le=100)] = None
+    duration: Optional[conint(ge=1, le=3600)] = None
@@ -1,8 +1,10 @@
 # apis/routes.py
 from fastapi import APIRouter
-from apis import webhook, channel, status
+from apis import webhook, channel, status, admin, stats
 
 api_router = APIRouter()
 api_router.include_router(webhook.router, tags=["webhooks"])
 api_router.include_router(channel.router, tags=["channels"])
-api_router.include_router(status.router, tags=["system"])
\ No newline at end of file
+api_router.include_router(status.router, tags=["system"])
+api_router.include_router(stats.router, tags=["stats"])
+api_router.include_router(admin.router, tags=["admin"])
\ No newline at end of file
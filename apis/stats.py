@@ -0,0 +1,90 @@
+# apis/stats.py
+from fastapi import APIRouter, Query, Response
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Dict, Any, List, Optional
+from utils.config import Config
+from utils.db_manager import DatabaseManager, LAG_BUCKET_BOUNDS, ALL_CHANNELS
+from utils.time_utils import get_current_utc
+
+router = APIRouter()
+db = DatabaseManager()
+
+PERCENTILES = (0.5, 0.9, 0.99)
+
+
+def _lag_percentile(buckets: List[int], total: int, q: float) -> Optional[float]:
+    """히스토그램 구간 안에서 선형 보간해 감지 지연 시간 백분위수(초)를 추정합니다.
+
+    마지막 구간(상한 없음)에 속하면 가장 큰 구간 경계를 반환합니다.
+    """
+    if total == 0:
+        return None
+    target = q * total
+    cumulative = 0
+    for i, count in enumerate(buckets):
+        if count and cumulative + count >= target:
+            if i == len(LAG_BUCKET_BOUNDS):
+                return float(LAG_BUCKET_BOUNDS[-1])
+            lower = LAG_BUCKET_BOUNDS[i - 1] if i > 0 else 0
+            upper = LAG_BUCKET_BOUNDS[i]
+            return round(lower + (upper - lower) * (target - cumulative) / count, 1)
+        cumulative += count
+    return float(LAG_BUCKET_BOUNDS[-1])
+
+
+@router.get("/stats/notifications")
+async def get_notification_stats(
+        yt_channel_id: Optional[str] = Query(None, description="채널 ID (생략 시 전체)"),
+        days: int = Query(7, ge=1, le=365)
+) -> Dict[str, Any]:
+    """알림 전송 성공률과 감지 지연 시간(게시 → 감지) 백분위수를 반환합니다.
+
+    일별 rollup만 조회하므로 알림 이력 크기와 관계없이 days개 행만 읽습니다.
+    """
+    days = min(days, Config.NOTIFICATION_RETENTION_DAYS)
+    since_day = (get_current_utc() - timedelta(days=days - 1)).date().isoformat()
+    rows = db.get_notification_stats(yt_channel_id or ALL_CHANNELS, since_day)
+
+    sent = sum(row.sent_count for row in rows)
+    failed = sum(row.failed_count for row in rows)
+    lag_count = sum(row.lag_count for row in rows)
+    lag_sum = sum(row.lag_sum_seconds for row in rows)
+    buckets = [sum(counts) for counts in zip(*(row.lag_buckets for row in rows))] or \
+        [0] * (len(LAG_BUCKET_BOUNDS) + 1)
+    total = sent + failed
+
+    return {
+        'yt_channel_id': yt_channel_id,
+        'days': days,
+        'sent': sent,
+        'failed': failed,
+        'success_rate': round(sent / total, 4) if total else None,
+        'detection_lag_seconds': {
+            'mean': round(lag_sum / lag_count, 1) if lag_count else None,
+            **{f"p{int(q * 100)}": _lag_percentile(buckets, lag_count, q) for q in PERCENTILES}
+        },
+        'lag_histogram': {
+            'bounds': LAG_BUCKET_BOUNDS,
+            'counts': buckets
+        },
+        'daily': [
+            {'day': row.day, 'sent': row.sent_count, 'failed': row.failed_count}
+            for row in rows
+        ]
+    }
+
+
+@router.get("/notifications")
+async def list_notifications(
+        response: Response,
+        cursor: Optional[int] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+        limit: int = Query(100, ge=1, le=500),
+        yt_channel_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """알림 전송 이력을 최신순으로 조회합니다."""
+    logs = db.get_notification_log_page(before_id=cursor, limit=limit + 1, yt_channel_id=yt_channel_id)
+    if len(logs) > limit:
+        logs = logs[:limit]
+        response.headers['X-Next-Cursor'] = str(logs[-1].id)
+    return [asdict(log) for log in logs]
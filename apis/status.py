@@ -1,17 +1,74 @@
 # apis/status.py
-from fastapi import APIRouter
-from typing import Dict, Any
+import asyncio
+import json
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from dataclasses import asdict
+from typing import Dict, Any, List
+from utils.status_tracker import status_tracker
+from utils.circuit_breaker import circuit_breakers
 from utils.config import Config
-from utils.db_manager import DatabaseManager
 
 router = APIRouter()
 
+# SSE 연결 유지용 heartbeat 간격 (초)
+HEARTBEAT_INTERVAL = 15
+
+# 스트림이 끝난 뒤 클라이언트(EventSource)가 다시 연결하기까지의 대기 시간 (밀리초)
+RECONNECT_DELAY_MS = 1000
+
+
 @router.get("/system/status")
 async def get_system_status() -> Dict[str, Any]:
     """시스템 상태를 반환합니다."""
-    youtube_api = Config.YOUTUBE_API
-    return {
-        "status": "running",
-        "background_task_running": True,  # main.py의 background task 상태에 따라 변경
-        "youtube_api_quota_used": youtube_api.get_daily_quota_used()
-    }
\ No newline at end of file
+    return status_tracker.status()
+
+
+@router.get("/system/circuit-breakers")
+async def list_circuit_breakers() -> List[Dict[str, Any]]:
+    """실패 이력이 있는 웹훅/채널의 circuit breaker 상태를 반환합니다."""
+    return [asdict(breaker) for breaker in circuit_breakers.list_breakers()]
+
+
+@router.get("/system/events")
+async def stream_system_events(request: Request):
+    """백그라운드 작업 이벤트를 Server-Sent Events로 전달합니다.
+
+    연결 직후 현재 상태를 담은 status 이벤트를 한 번 보내고,
+    이후 폴링 사이클 시작/종료, 알림 전송/실패, quota 변경 이벤트를 전달합니다.
+
+    서버 종료 시 uvicorn은 열린 연결이 닫힐 때까지 기다리므로, 스트림은 EVENT_STREAM_MAX_DURATION마다
+    끝나고 클라이언트가 다시 연결해 status 이벤트로 상태를 동기화합니다.
+    """
+    queue = status_tracker.subscribe()
+
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + Config.EVENT_STREAM_MAX_DURATION
+        try:
+            initial = {'type': 'status', 'data': {}, 'status': status_tracker.status()}
+            yield f"retry: {RECONNECT_DELAY_MS}\nevent: status\ndata: {json.dumps(initial)}\n\n"
+
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=min(HEARTBEAT_INTERVAL, remaining))
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+
+                if event is None:
+                    break
+                yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+        finally:
+            status_tracker.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
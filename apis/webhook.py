@@ -16,14 +16,20 @@ class WebhookResponse(BaseModel):
     update_at: datetime
 
 # apis/webhook.py
-from fastapi import APIRouter, HTTPException
-from typing import List
+from dataclasses import asdict
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import TypeAdapter
+from typing import List, Optional
 from utils.db_manager import DatabaseManager
+from utils.circuit_breaker import circuit_breakers, WEBHOOK
+from .cache import cached_json_response, response_cache
 from .models import WebhookCreate, WebhookResponse
 
 router = APIRouter()
 db = DatabaseManager()
 
+webhook_list_adapter = TypeAdapter(List[WebhookResponse])
+
 @router.post("/webhooks", response_model=WebhookResponse, status_code=201)
 async def create_webhook(webhook: WebhookCreate):
     """새로운 웹훅을 등록합니다."""
@@ -33,6 +39,7 @@ async def create_webhook(webhook: WebhookCreate):
             webhook_name=webhook.webhook_name,
             url=str(webhook.url)
         )
+        response_cache.invalidate('webhooks')
         created_webhook = db.get_webhook(webhook_id)
         if created_webhook:
             return created_webhook
@@ -41,9 +48,25 @@ async def create_webhook(webhook: WebhookCreate):
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/webhooks", response_model=List[WebhookResponse])
-async def list_webhooks():
-    """등록된 모든 웹훅 목록을 조회합니다."""
-    return db.get_all_webhooks()
+async def list_webhooks(
+    request: Request,
+    cursor: Optional[int] = Query(None, ge=0, description="이전 페이지의 X-Next-Cursor 값"),
+    limit: int = Query(100, ge=1, le=500),
+    name: Optional[str] = Query(None, max_length=100, description="워크스페이스/웹훅 이름 검색어")
+):
+    """등록된 웹훅 목록을 페이지 단위로 조회합니다.
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
+    """
+    def build():
+        webhooks = db.get_webhooks_page(after_id=cursor or 0, limit=limit + 1, name=name)
+        next_cursor = str(webhooks[limit - 1].webhook_id) if len(webhooks) > limit else None
+        body = webhook_list_adapter.dump_json(
+            webhook_list_adapter.validate_python([asdict(wh) for wh in webhooks[:limit]])
+        )
+        return body, next_cursor
+
+    return cached_json_response(request, 'webhooks', (cursor, limit, name), build)
 
 @router.delete("/webhooks/{webhook_id}", status_code=204)
 async def delete_webhook(webhook_id: int):
@@ -58,4 +81,6 @@ async def delete_webhook(webhook_id: int):
 
     success = db.delete_webhook(webhook_id)
     if not success:
-        raise HTTPException(status_code=404, detail="Webhook not found")
\ No newline at end of file
+        raise HTTPException(status_code=404, detail="Webhook not found")
+    response_cache.invalidate('webhooks')
+    circuit_breakers.reset(WEBHOOK, str(webhook_id))
\ No newline at end of file
@@ -0,0 +1,116 @@
+# benchmarks/channel_registry.py
+"""채널 수가 많을 때 사이클 준비 비용을 비교합니다.
+
+- 기존 방식: 사이클마다 DB에서 Channel dataclass 목록을 읽고 dict/ID 목록으로 복사
+- 레지스트리: 시작 시 한 번 적재한 ChannelRegistry에서 폴링 대상 레코드와 ID 목록만 생성
+
+실행: python -m benchmarks.channel_registry [채널 수]
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import timedelta
+
+# 모듈 import 시 현재 디렉터리에 DB가 생성되므로 임시 디렉터리에서 실행
+os.chdir(tempfile.mkdtemp(prefix='registry-bench-'))
+
+from utils.db_manager import DatabaseManager, Channel  # noqa: E402
+from utils.channel_registry import ChannelRegistry  # noqa: E402
+from utils.time_utils import get_current_utc, format_utc  # noqa: E402
+
+CYCLES = 5
+
+
+def populate(db: DatabaseManager, count: int):
+    now = get_current_utc()
+    with db.get_connection() as conn:
+        conn.execute("INSERT INTO webhook (workspace_name, webhook_name, url) VALUES ('bench', 'bench', 'https://example.com')")
+        conn.executemany("""
+            INSERT INTO channel (webhook_id, yt_channel_id, yt_handling_id, yt_ch_name,
+                                 last_check_at, create_at, update_at, status, next_probe_at)
+            VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                f"UC{i:022d}", f"@handle{i}", f"Channel name {i}",
+                format_utc(now - timedelta(seconds=i)), format_utc(now), format_utc(now),
+                'dormant' if i % 50 == 0 else 'active',
+                format_utc(now + timedelta(days=1)) if i % 50 == 0 else None
+            )
+            for i in range(count)
+        ])
+        conn.commit()
+
+
+def measure(func):
+    """(평균 소요 시간, 할당 후 유지된 메모리, 최대 메모리)를 반환합니다."""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    elapsed = []
+    for _ in range(CYCLES):
+        start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - start)
+    return sum(elapsed) / len(elapsed), retained, peak
+
+
+def legacy_pollable_channels(db: DatabaseManager):
+    """레지스트리 도입 전 사이클마다 실행하던 폴링 대상 조회 쿼리"""
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT * FROM channel
+            WHERE status = 'active'
+               OR (status = 'dormant' AND next_probe_at <= ?)
+            ORDER BY id
+        """, (format_utc(get_current_utc()),))
+        return [Channel(**dict(row)) for row in cursor.fetchall()]
+
+
+def legacy_cycle_setup(db: DatabaseManager):
+    channels = legacy_pollable_channels(db)
+    channel_infos = [
+        {'yt_channel_id': ch.yt_channel_id, 'yt_ch_name': ch.yt_ch_name}
+        for ch in channels
+    ]
+    channel_ids = [ch['yt_channel_id'] for ch in channel_infos]
+    return channels, channel_infos, channel_ids
+
+
+def registry_cycle_setup(registry: ChannelRegistry):
+    channels = registry.pollable()
+    channel_ids = [ch.yt_channel_id for ch in channels]
+    return channels, channel_ids
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    db = DatabaseManager('bench.db')
+    populate(db, count)
+    print(f"{count} channels ({count // 50} dormant)")
+
+    def load():
+        return ChannelRegistry(db)
+
+    for label, func in (
+        ('legacy: all channels as dataclasses', db.get_all_channels),
+        ('registry: load', load),
+        ('legacy: per-cycle setup', lambda: legacy_cycle_setup(db)),
+    ):
+        avg, retained, peak = measure(func)
+        print(f"{label:40s} {avg * 1000:9.1f} ms  retained {retained / 2**20:7.1f} MiB  peak {peak / 2**20:7.1f} MiB")
+
+    registry = ChannelRegistry(db)
+    avg, retained, peak = measure(lambda: registry_cycle_setup(registry))
+    print(f"{'registry: per-cycle setup':40s} {avg * 1000:9.1f} ms  retained {retained / 2**20:7.1f} MiB  peak {peak / 2**20:7.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
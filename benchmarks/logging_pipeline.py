@@ -0,0 +1,146 @@
+# benchmarks/logging_pipeline.py
+"""폴링 사이클 규모의 로그를 남길 때 호출 스레드가 로깅에 쓰는 시간을 비교합니다.
+
+- 기존 방식: basicConfig 스타일 동기 StreamHandler + f-string 즉시 포맷
+- 큐 기반: setup_logging (QueueHandler + listener 스레드, JSON 출력, 지연 포맷, 반복 오류 제한)
+
+채널마다 API 호출 로그와 알림 전송 로그를 남기고, 10%의 채널은 폐기된 같은 웹훅으로 전송하다 실패합니다.
+출력 대상은 두 가지입니다.
+
+- file: 임시 파일 (빠른 출력)
+- pipe: 읽는 쪽이 느린 파이프 (컨테이너 로그 드라이버가 밀려 stdout 쓰기가 막히는 상황)
+
+큐 기반 방식의 호출 스레드 비용이 확실히 줄어드는 것은 pipe 출력뿐입니다.
+file 출력에서는 JSON 포맷과 큐 전달 비용 때문에 기존 방식과 비슷하거나 더 느릴 수 있습니다.
+
+실행: python -m benchmarks.logging_pipeline [채널 수] [사이클 수]
+"""
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from utils.logging_config import setup_logging, stop_logging, TEXT_FORMAT
+
+logger = logging.getLogger('bench.poll')
+
+# pipe 출력을 읽는 쪽의 처리 속도 (4KB마다 1ms 대기, 약 4MB/s)
+PIPE_READ_SIZE = 4096
+PIPE_READ_DELAY = 0.001
+
+
+def legacy_cycle(channels: int):
+    for i in range(channels):
+        channel_id = f"UC{i:022d}"
+        logger.info(f"YouTube API call: check_new_videos_batch - Duration: {0.123456}s")
+        logger.info(f"Successfully sent notification for channel 'Channel {i}' - Video: Video title {i}")
+        if i % 10 == 0:
+            logger.error(f"Failed to send Slack notification: 404 - Channel: {channel_id}, Video: Video title {i}")
+
+
+def queued_cycle(channels: int):
+    for i in range(channels):
+        channel_id = f"UC{i:022d}"
+        logger.info("YouTube API call: %s - Duration: %.3fs", 'check_new_videos_batch', 0.123456,
+                    extra={'api_call': 'check_new_videos_batch'})
+        logger.info("Successfully sent notification for channel '%s' - Video: %s", f"Channel {i}", f"Video title {i}",
+                    extra={'channel_id': channel_id, 'webhook_id': 1})
+        if i % 10 == 0:
+            logger.error("Failed to send Slack notification: %s - Channel: %s, Video: %s",
+                         404, channel_id, f"Video title {i}", extra={'webhook_id': 2, 'status_code': 404})
+
+
+class FileSink:
+    def __init__(self, path: str):
+        self.path = path
+        self.stream = open(path, 'w')
+
+    def finish(self) -> int:
+        self.stream.close()
+        with open(self.path) as f:
+            return sum(1 for _ in f)
+
+
+class SlowPipeSink:
+    def __init__(self):
+        read_fd, write_fd = os.pipe()
+        self.stream = os.fdopen(write_fd, 'w')
+        self.lines = 0
+        self._reader = threading.Thread(target=self._read, args=(read_fd,), daemon=True)
+        self._reader.start()
+
+    def _read(self, read_fd: int):
+        with os.fdopen(read_fd, 'rb') as f:
+            while True:
+                data = f.read1(PIPE_READ_SIZE)
+                if not data:
+                    return
+                self.lines += data.count(b'\n')
+                time.sleep(PIPE_READ_DELAY)
+
+    def finish(self) -> int:
+        self.stream.close()
+        self._reader.join()
+        return self.lines
+
+
+def run_legacy(sink, channels: int, cycles: int):
+    root = logging.getLogger()
+    handler = logging.StreamHandler(sink.stream)
+    handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+
+    start = time.perf_counter()
+    for _ in range(cycles):
+        legacy_cycle(channels)
+    hot_path = time.perf_counter() - start
+    handler.flush()
+    total = time.perf_counter() - start
+    root.handlers = []
+    return hot_path, total, sink.finish()
+
+
+def run_queued(sink, channels: int, cycles: int):
+    stdout = sys.stdout
+    sys.stdout = sink.stream
+    try:
+        setup_logging('INFO', 'json', error_burst=5, error_window=60)
+        start = time.perf_counter()
+        for _ in range(cycles):
+            queued_cycle(channels)
+        hot_path = time.perf_counter() - start
+        stop_logging()
+        sink.stream.flush()
+        total = time.perf_counter() - start
+    finally:
+        sys.stdout = stdout
+        logging.getLogger().handlers = []
+    return hot_path, total, sink.finish()
+
+
+def report(label: str, channels: int, cycles: int, result):
+    hot_path, total, lines = result
+    print(f"{label:14s} hot path {hot_path * 1000:8.1f} ms  "
+          f"({hot_path / (channels * cycles) * 1e6:6.1f} us/channel)  "
+          f"until flushed {total * 1000:8.1f} ms  lines {lines}")
+
+
+def main():
+    channels = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    cycles = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    print(f"{channels} channels x {cycles} cycles")
+    output_dir = tempfile.mkdtemp(prefix='logging-bench-')
+
+    report('legacy/file', channels, cycles,
+           run_legacy(FileSink(os.path.join(output_dir, 'legacy.log')), channels, cycles))
+    report('legacy/pipe', channels, cycles, run_legacy(SlowPipeSink(), channels, cycles))
+    report('queued/file', channels, cycles,
+           run_queued(FileSink(os.path.join(output_dir, 'queued.log')), channels, cycles))
+    report('queued/pipe', channels, cycles, run_queued(SlowPipeSink(), channels, cycles))
+
+
+if __name__ == '__main__':
+    main()
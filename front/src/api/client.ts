@@ -1,9 +1,10 @@
 // api/client.ts
-import type { Webhook, Channel, SystemStatus } from '../types/api';
+import type { Webhook, Channel, SystemStatus, SystemEvent, CheckNowResult } from '../types/api';
 
 const API_HOST = import.meta.env.VITE_API_HOST || 'http://localhost';
 const API_PORT = import.meta.env.VITE_API_PORT || '8000';
 const API_BASE_URL = `${API_HOST}:${API_PORT}/api/v1`;
+const BACKGROUND_BASE_URL = `${API_HOST}:${API_PORT}/background`;
 
 // 공통 fetch 함수
 async function fetchAPI<T>(url: string, options: RequestInit = {}): Promise<T> {
@@ -27,8 +28,28 @@ async function fetchAPI<T>(url: string, options: RequestInit = {}): Promise<T> {
   return response.json();
 }
 
+// 커서 기반 목록 API의 모든 페이지 조회
+async function fetchAllPages<T>(url: string): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const pageUrl: string = cursor ? `${url}?cursor=${encodeURIComponent(cursor)}` : url;
+    const response = await fetch(pageUrl, {
+      headers: { 'Content-Type': 'application/json' },
+    });
+    if (!response.ok) {
+      throw new Error(`Request failed with status ${response.status}`);
+    }
+    items.push(...(await response.json()));
+    cursor = response.headers.get('X-Next-Cursor');
+  } while (cursor);
+
+  return items;
+}
+
 export async function fetchWebhooks(): Promise<Webhook[]> {
-  return fetchAPI<Webhook[]>(`${API_BASE_URL}/webhooks`);
+  return fetchAllPages<Webhook>(`${API_BASE_URL}/webhooks`);
 }
 
 export async function createWebhook(data: {
@@ -49,7 +70,7 @@ export async function deleteWebhook(id: number): Promise<void> {
 }
 
 export async function fetchChannels(): Promise<Channel[]> {
-  return fetchAPI<Channel[]>(`${API_BASE_URL}/channels`);
+  return fetchAllPages<Channel>(`${API_BASE_URL}/channels`);
 }
 
 export async function createChannel(data: {
@@ -68,6 +89,37 @@ export async function deleteChannel(id: number): Promise<void> {
   });
 }
 
+// 채널 즉시 확인 (같은 채널은 cooldown 동안 429 반환)
+export async function checkChannelNow(id: number): Promise<CheckNowResult> {
+  return fetchAPI<CheckNowResult>(`${BACKGROUND_BASE_URL}/check/channels/${id}`, {
+    method: 'POST',
+  });
+}
+
 export async function getSystemStatus(): Promise<SystemStatus> {
   return fetchAPI<SystemStatus>(`${API_BASE_URL}/system/status`);
-}
\ No newline at end of file
+}
+
+// 시스템 이벤트 스트림 구독 (Server-Sent Events), 구독 해제 함수 반환
+export function subscribeSystemEvents(onEvent: (event: SystemEvent) => void): () => void {
+  const source = new EventSource(`${API_BASE_URL}/system/events`);
+  const eventTypes = [
+    'status',
+    'background_started',
+    'background_stopped',
+    'cycle_started',
+    'cycle_finished',
+    'notification_sent',
+    'notification_failed',
+    'quota_changed',
+    'circuit_breaker_changed',
+    'channel_status_changed',
+    'backfill_started',
+    'backfill_finished',
+  ];
+
+  const handler = (e: MessageEvent) => onEvent(JSON.parse(e.data) as SystemEvent);
+  eventTypes.forEach((type) => source.addEventListener(type, handler));
+
+  return () => source.close();
+}
@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
-import { fetchWebhooks, fetchChannels, deleteWebhook, deleteChannel, getSystemStatus } from '../api/client';
+import { fetchWebhooks, fetchChannels, deleteWebhook, deleteChannel, checkChannelNow, getSystemStatus, subscribeSystemEvents } from '../api/client';
 import { Webhook, Channel, SystemStatus } from '../types/api';
-import { Trash2, Youtube, Bell, Activity, AlertCircle } from 'lucide-react';
+import { Trash2, Youtube, Bell, Activity, AlertCircle, RefreshCw } from 'lucide-react';
 import WebhookForm from './WebhookForm';
 import ChannelForm from './ChannelForm';
 import StatusCard from './StatusCard';
@@ -12,6 +12,7 @@ export default function Dashboard() {
   const [systemStatus, setSystemStatus] = useState<SystemStatus | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [checkingIds, setCheckingIds] = useState<number[]>([]);
 
   const loadData = async () => {
     try {
@@ -35,6 +36,16 @@ export default function Dashboard() {
     loadData();
   }, []);
 
+  // 상태는 폴링 대신 서버 이벤트 스트림으로 갱신
+  useEffect(() => {
+    return subscribeSystemEvents((event) => {
+      setSystemStatus(event.status);
+      if (event.type === 'channel_status_changed') {
+        fetchChannels().then(setChannels).catch(() => setError('Failed to load data'));
+      }
+    });
+  }, []);
+
   const handleDeleteWebhook = async (id: number) => {
     if (!confirm('Are you sure you want to delete this webhook?')) return;
     try {
@@ -55,6 +66,18 @@ export default function Dashboard() {
     }
   };
 
+  const handleCheckChannel = async (id: number) => {
+    setCheckingIds((ids) => [...ids, id]);
+    try {
+      await checkChannelNow(id);
+      setError('');
+    } catch (err) {
+      setError('Failed to check channel (it may have been checked recently)');
+    } finally {
+      setCheckingIds((ids) => ids.filter((checkingId) => checkingId !== id));
+    }
+  };
+
   if (loading) {
     return (
       <div className="flex justify-center items-center h-screen">
@@ -155,7 +178,14 @@ export default function Dashboard() {
                     >
                       <div className="flex justify-between items-start">
                         <div>
-                          <h3 className="font-semibold text-gray-800">{channel.yt_ch_name}</h3>
+                          <h3 className="font-semibold text-gray-800 flex items-center gap-2">
+                            {channel.yt_ch_name}
+                            {channel.status === 'dormant' && (
+                              <span className="text-xs font-normal bg-gray-200 text-gray-600 px-2 py-0.5 rounded">
+                                dormant
+                              </span>
+                            )}
+                          </h3>
                           <p className="text-sm text-gray-600">
                             Channel ID: {channel.yt_channel_id}
                           </p>
@@ -165,12 +195,22 @@ export default function Dashboard() {
                             }
                           </p>
                         </div>
-                        <button
-                          onClick={() => handleDeleteChannel(channel.id)}
-                          className="text-gray-400 hover:text-red-600 transition-colors duration-200 opacity-0 group-hover:opacity-100"
-                        >
-                          <Trash2 size={20} />
-                        </button>
+                        <div className="flex gap-2">
+                          <button
+                            onClick={() => handleCheckChannel(channel.id)}
+                            disabled={checkingIds.includes(channel.id)}
+                            title="Check now"
+                            className="text-gray-400 hover:text-blue-600 transition-colors duration-200 opacity-0 group-hover:opacity-100 disabled:opacity-100"
+                          >
+                            <RefreshCw size={20} className={checkingIds.includes(channel.id) ? 'animate-spin' : ''} />
+                          </button>
+                          <button
+                            onClick={() => handleDeleteChannel(channel.id)}
+                            className="text-gray-400 hover:text-red-600 transition-colors duration-200 opacity-0 group-hover:opacity-100"
+                          >
+                            <Trash2 size={20} />
+                          </button>
+                        </div>
                       </div>
                     </div>
                   ))}
@@ -13,7 +13,7 @@ export default function StatusCard({ status }: Props) {
         <Activity className="text-blue-600" />
         System Status
       </h2>
-      <div className="grid md:grid-cols-3 gap-6">
+      <div className="grid md:grid-cols-4 gap-6">
         <div className="bg-gray-50 rounded-lg p-4">
           <p className="text-sm text-gray-500 mb-1">Service Status</p>
           <p className="font-semibold text-gray-800 flex items-center gap-2">
@@ -38,6 +38,21 @@ export default function StatusCard({ status }: Props) {
             {status.youtube_api_quota_used.toLocaleString()}
           </p>
         </div>
+        <div className="bg-gray-50 rounded-lg p-4">
+          <p className="text-sm text-gray-500 mb-1">Last Check</p>
+          <p className="font-semibold text-gray-800">
+            {status.cycle_running
+              ? `Checking ${status.last_cycle_channels ?? 0} channels...`
+              : status.last_cycle_finished_at
+                ? new Date(status.last_cycle_finished_at).toLocaleString()
+                : '-'}
+          </p>
+          {!status.cycle_running && status.last_cycle_finished_at && (
+            <p className="text-sm text-gray-500">
+              {status.last_cycle_notifications ?? 0} sent, {status.last_cycle_failures ?? 0} failed
+            </p>
+          )}
+        </div>
       </div>
     </div>
   );
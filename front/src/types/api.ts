@@ -14,6 +14,7 @@ export interface Channel {
   yt_channel_id: string;
   yt_handling_id: string;
   yt_ch_name: string;
+  status: 'active' | 'dormant';
   create_at: string;
   update_at: string;
 }
@@ -22,4 +23,29 @@ export interface SystemStatus {
   status: string;
   background_task_running: boolean;
   youtube_api_quota_used: number;
-}
\ No newline at end of file
+  cycle_running?: boolean;
+  last_cycle_started_at?: string | null;
+  last_cycle_finished_at?: string | null;
+  last_cycle_duration?: number | null;
+  last_cycle_channels?: number;
+  last_cycle_notifications?: number;
+  last_cycle_failures?: number;
+  last_cycle_carried_over?: number;
+  total_notifications?: number;
+  total_failures?: number;
+  circuit_breakers_open?: number;
+  backfill_running?: boolean;
+}
+
+export interface SystemEvent {
+  type: string;
+  timestamp?: string;
+  data: Record<string, unknown>;
+  status: SystemStatus;
+}
+
+export interface CheckNowResult {
+  status: 'checked' | 'joined';
+  channels: number;
+  notifications: number;
+}
@@ -1,93 +1,268 @@
 # main.py
+import math
 import time
 import logging
 import asyncio
 from dotenv import load_dotenv
 import os
+import threading
 
-from datetime import timedelta
-from fastapi import FastAPI
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from apis.routers import api_router
 from utils.config import Config
+from utils.logging_config import setup_logging
 from utils.db_manager import DatabaseManager
-from utils.slack_sender import SlackSender
+from utils.slack_sender import SlackSender, SENT, SKIPPED
+from utils.status_tracker import status_tracker
+from utils.circuit_breaker import circuit_breakers
+from utils.channel_registry import channel_registry
+from apis.cache import response_cache
+from utils.profiler import cycle_profiler
+from utils.tracing import tracer
+from utils.scheduler import PollScheduler
+from utils.single_flight import SingleFlight, CooldownActive
+from utils.youtube_api import CHANNELS_PER_REQUEST, ChannelCheckResult
 from utils.time_utils import get_current_utc, format_utc
 
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# 로깅 설정 (큐 기반 비동기 출력)
+setup_logging(
+    level=Config.LOG_LEVEL,
+    fmt=Config.LOG_FORMAT,
+    error_burst=Config.LOG_ERROR_BURST,
+    error_window=Config.LOG_ERROR_WINDOW
 )
 logger = logging.getLogger(__name__)
 
+# 프로파일러/트레이서 설정
+cycle_profiler.configure(output_dir=Config.PROFILE_DIR, sample_interval=Config.PROFILE_SAMPLE_INTERVAL)
+tracer.configure(
+    exporter=Config.TRACING_EXPORTER,
+    sample_ratio=Config.TRACING_SAMPLE_RATIO,
+    jsonl_path=Config.TRACING_JSONL_PATH,
+    otlp_endpoint=Config.TRACING_OTLP_ENDPOINT
+)
+
 # 공유 객체
 db = DatabaseManager()
 youtube_api = Config.YOUTUBE_API
-slack_sender = SlackSender(db)
+slack_sender = SlackSender(db, circuit_breakers)
 
 # 백그라운드 작업 상태
-is_running = False
-background_task = None
+backfill_task = None
+# 폴링 사이클과 backfill이 동시에 실행되어 중복 알림이 나가지 않도록 보호
+cycle_lock = asyncio.Lock()
+# 필터링 → 전송 → 마지막 확인 시간 갱신은 작업 스레드에서 실행되므로 한 번에 하나씩 처리 (중복 전송 방지)
+notify_lock = threading.Lock()
+# deadline 내에 처리하지 못해 다음 사이클로 넘어간 채널
+pending_channel_ids: List[str] = []
+# 즉시 확인 요청의 대상별 단일 실행/cooldown
+check_now_flight = SingleFlight(cooldown=Config.CHECK_NOW_COOLDOWN)
+
+
+def send_new_videos(channels, new_videos_by_channel, detected_at: datetime) -> int:
+    """채널별 새 동영상 알림을 게시 시간순으로 전송하고 마지막 확인 시간을 갱신합니다.
+
+    전송에 실패하면 해당 채널의 나머지 동영상은 다음 사이클로 미루고, 마지막 확인 시간은
+    마지막으로 전송에 성공한 동영상의 게시 시간까지만 옮겨 실패한 동영상을 다시 전송하도록 합니다.
+
+    Args:
+        detected_at: 동영상 조회가 끝난 시각 (감지 지연 시간 계산용)
+
+    Returns:
+        int: 전송에 성공한 알림 수
+    """
+    notification_count = 0
+    watermark_updated = False
+    for channel in channels:
+        new_videos = new_videos_by_channel.get(channel.yt_channel_id, [])
+        last_sent_at = None
+
+        for video in sorted(new_videos, key=lambda v: v['published_at']):
+            status = slack_sender.send_notification(
+                channel.yt_channel_id,
+                {
+                    'title': video['title'],
+                    'url': f"https://www.youtube.com/watch?v={video['video_id']}",
+                    'published_at': format_utc(video['published_at'])
+                }
+            )
+            # 웹훅 breaker가 열려 건너뛴 경우는 전송 시도가 아니므로 이력/통계에 남기지 않음
+            if status == SKIPPED:
+                break
+
+            success = status == SENT
+            if success:
+                notification_count += 1
+                last_sent_at = video['published_at']
+                status_tracker.publish(
+                    'notification_sent',
+                    yt_channel_id=channel.yt_channel_id,
+                    video_id=video['video_id'],
+                    title=video['title']
+                )
+            else:
+                status_tracker.publish(
+                    'notification_failed',
+                    yt_channel_id=channel.yt_channel_id,
+                    video_id=video['video_id'],
+                    title=video['title']
+                )
+
+            with cycle_profiler.stage('db_write'):
+                try:
+                    db.record_notification(
+                        video['video_id'],
+                        channel.yt_channel_id,
+                        channel.webhook_id,
+                        video['published_at'],
+                        detected_at,
+                        get_current_utc() if success else None,
+                        status
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Failed to record notification history for %s: %s", video['video_id'], e,
+                        extra={'channel_id': channel.yt_channel_id}
+                    )
+
+            if not success:
+                break
+
+        # 마지막 확인 시간 업데이트 (전송에 성공한 동영상까지만)
+        if last_sent_at is not None:
+            with cycle_profiler.stage('db_write'):
+                db.update_last_check_time(channel.yt_channel_id, last_sent_at)
+            channel_registry.set_last_check(channel.yt_channel_id, last_sent_at)
+            watermark_updated = True
+
+    # 마지막 확인 시간이 바뀌면 트리거가 update_at을 갱신하므로 캐시된 채널 목록 응답을 무효화
+    if watermark_updated:
+        response_cache.invalidate('channels')
+
+    return notification_count
+
+
+def since_by_channel(channels) -> Dict[str, datetime]:
+    """채널별 마지막 확인 시간을 반환합니다. (같은 채널이 여러 웹훅에 등록된 경우 가장 이른 시간)"""
+    since = {}
+    for channel in channels:
+        last_check = channel_registry.last_check_at(channel)
+        if channel.yt_channel_id not in since or last_check < since[channel.yt_channel_id]:
+            since[channel.yt_channel_id] = last_check
+    return since
+
+
+def process_new_videos(channels, result: ChannelCheckResult, detected_at: datetime) -> int:
+    """조회한 동영상을 채널별 마지막 확인 시간으로 거른 뒤 알림을 전송하고 채널 상태를 갱신합니다.
+
+    Slack 전송이 이벤트 루프를 막지 않도록 asyncio.to_thread로 호출합니다.
+
+    Returns:
+        int: 전송에 성공한 알림 수
+    """
+    with notify_lock:
+        return _process_new_videos(channels, result, detected_at)
+
+
+def _process_new_videos(channels, result: ChannelCheckResult, detected_at: datetime) -> int:
+    # 채널별 마지막 확인 시간 이전 영상은 이미 전송된 것으로 보고 제외 (backfill 등)
+    new_videos_by_channel = result.videos
+    with cycle_profiler.stage('filtering'):
+        for channel in channels:
+            videos = new_videos_by_channel.get(channel.yt_channel_id)
+            if videos:
+                channel_last_check = channel_registry.last_check_at(channel)
+                new_videos_by_channel[channel.yt_channel_id] = [
+                    v for v in videos if v['published_at'] > channel_last_check
+                ]
+
+    # 알림 전송
+    notification_count = send_new_videos(channels, new_videos_by_channel, detected_at)
 
+    with cycle_profiler.stage('db_write'):
+        update_channel_health(channels, result)
+    return notification_count
 
-async def check_new_videos():
-    """새로운 영상을 확인하고 알림을 보냅니다."""
-    global is_running
+
+async def poll_cycle(deadline: float):
+    """스케줄러가 tick마다 호출하는 폴링 사이클입니다."""
+    async with cycle_lock:
+        with cycle_profiler.profile_cycle(), tracer.span('poll_cycle'):
+            await run_check_cycle(deadline)
+
+
+async def run_check_cycle(deadline: Optional[float] = None):
+    """폴링 사이클을 한 번 실행합니다.
+
+    채널을 channels.list 요청 단위(50개)로 나눠 처리하며, deadline(이벤트 루프 시각)이 지나면
+    남은 채널을 다음 사이클에서 가장 먼저 처리하도록 넘깁니다.
+    조회와 전송은 스레드에서 실행하므로 사이클 중에도 API와 이벤트 스트림이 응답합니다.
+    """
+    global pending_channel_ids
+    loop = asyncio.get_running_loop()
     try:
         logger.info("Checking for new videos...")
         start_time = time.time()
 
-        # 모든 채널 조회
-        channels = db.get_all_channels()
+        # 폴링 대상 채널 조회 (활성 채널 + 재확인 시각이 된 휴면 채널)
+        channels = channel_registry.pollable()
         if not channels:
             logger.info("No channels to check")
             return
 
-        logger.info(f"Checking {len(channels)} channels for new videos")
-
-        # 채널 정보 준비
-        channel_infos = [
-            {
-                'yt_channel_id': ch.yt_channel_id,
-                'yt_ch_name': ch.yt_ch_name
-            }
-            for ch in channels
-        ]
+        # 이전 사이클에서 처리하지 못한 채널을 앞으로 정렬
+        if pending_channel_ids:
+            pending = set(pending_channel_ids)
+            channels.sort(key=lambda ch: ch.yt_channel_id not in pending)
+        pending_channel_ids = []
 
-        # 최신 동영상 배치 조회
-        try:
-            last_check = get_current_utc() - timedelta(hours=1)  # 1시간 전부터 체크
-            new_videos_by_channel = youtube_api.check_new_videos_batch(
-                channel_infos,
-                last_check
-            )
-        except Exception as e:
-            logger.error(f"Error checking new videos: {e}")
-            return
+        logger.info(f"Checking {len(channels)} channels for new videos")
+        status_tracker.publish('cycle_started', channels=len(channels))
 
-        # 알림 전송
         notification_count = 0
-        for channel in channels:
-            new_videos = new_videos_by_channel.get(channel.yt_channel_id, [])
-
-            for video in new_videos:
-                success = slack_sender.send_notification(
-                    channel.yt_channel_id,
-                    {
-                        'title': video['title'],
-                        'url': f"https://www.youtube.com/watch?v={video['video_id']}",
-                        'published_at': format_utc(video['published_at'])
-                    }
+        for i in range(0, len(channels), CHANNELS_PER_REQUEST):
+            if deadline is not None and loop.time() >= deadline:
+                pending_channel_ids = [ch.yt_channel_id for ch in channels[i:]]
+                logger.warning(
+                    f"Cycle deadline reached, carrying {len(pending_channel_ids)} channels "
+                    f"over to the next cycle"
                 )
-                if success:
-                    notification_count += 1
-
-            # 마지막 확인 시간 업데이트
-            if new_videos:
-                db.update_last_check_time(channel.yt_channel_id)
+                break
+
+            chunk = channels[i:i + CHANNELS_PER_REQUEST]
+            with tracer.span('poll_chunk', channels=len(chunk)) as span:
+                # 최신 동영상 배치 조회
+                try:
+                    result = await asyncio.to_thread(
+                        youtube_api.check_new_videos_batch,
+                        since_by_channel(chunk),
+                        Config.POLL_MAX_PAGES,
+                        circuit_breakers
+                    )
+                except Exception as e:
+                    # 처리하지 못한 채널은 다음 사이클에서 가장 먼저 처리
+                    pending_channel_ids = [ch.yt_channel_id for ch in channels[i:]]
+                    logger.error(f"Error checking new videos: {e}")
+                    span.record_error(e)
+                    status_tracker.update_quota(youtube_api.get_daily_quota_used())
+                    status_tracker.publish(
+                        'cycle_finished',
+                        duration=time.time() - start_time,
+                        error=str(e),
+                        carried_over=len(pending_channel_ids)
+                    )
+                    return
+
+                chunk_notifications = await asyncio.to_thread(
+                    process_new_videos, chunk, result, get_current_utc()
+                )
+                notification_count += chunk_notifications
+                span.set_attribute('notifications', chunk_notifications)
 
         elapsed_time = time.time() - start_time
         logger.info(
@@ -95,42 +270,207 @@ async def check_new_videos():
             f"Sent {notification_count} notifications. "
             f"Quota usage: {youtube_api.get_daily_quota_used()}"
         )
+        status_tracker.update_quota(youtube_api.get_daily_quota_used())
+
+        # 보관 기간이 지난 알림 이력 정리
+        with cycle_profiler.stage('db_write'):
+            retention_cutoff = get_current_utc() - timedelta(days=Config.NOTIFICATION_RETENTION_DAYS)
+            pruned = db.prune_notification_history(retention_cutoff)
+        if pruned:
+            logger.info(f"Pruned {pruned} notification history entries older than {format_utc(retention_cutoff)}")
+
+        status_tracker.publish(
+            'cycle_finished',
+            duration=elapsed_time,
+            notifications=notification_count,
+            carried_over=len(pending_channel_ids)
+        )
 
     except Exception as e:
         logger.error(f"Error in check_new_videos: {e}", exc_info=True)
+        status_tracker.publish('cycle_finished', error=str(e))
+
+
+async def run_backfill():
+    """다운타임 동안 누락된 영상을 채널별 마지막 확인 시간부터 조회해 전송합니다."""
+    async with cycle_lock:
+        try:
+            start_time = time.time()
+            channels = channel_registry.pollable()
+            if not channels:
+                return
+
+            logger.info(f"Backfilling missed videos for {len(channels)} channels")
+            status_tracker.publish('backfill_started', channels=len(channels))
+
+            with tracer.span('backfill', channels=len(channels)) as span:
+                channel_infos = [
+                    {'yt_channel_id': ch.yt_channel_id, 'since': channel_registry.last_check_at(ch)}
+                    for ch in channels
+                ]
+                result = await asyncio.to_thread(
+                    youtube_api.backfill_new_videos,
+                    channel_infos,
+                    Config.BACKFILL_MAX_PAGES,
+                    Config.BACKFILL_CONCURRENCY,
+                    circuit_breakers
+                )
+                # 조회 중에 즉시 확인으로 전송된 영상이 있을 수 있으므로 현재 마지막 확인 시간으로 다시 거름
+                notification_count = await asyncio.to_thread(
+                    process_new_videos, channels, result, get_current_utc()
+                )
+                span.set_attribute('notifications', notification_count)
+
+            elapsed_time = time.time() - start_time
+            logger.info(
+                f"Backfill completed in {elapsed_time:.2f} seconds. "
+                f"Sent {notification_count} notifications. "
+                f"Quota usage: {youtube_api.get_daily_quota_used()}"
+            )
+            status_tracker.update_quota(youtube_api.get_daily_quota_used())
+            status_tracker.publish(
+                'backfill_finished',
+                duration=elapsed_time,
+                notifications=notification_count
+            )
+
+        except Exception as e:
+            logger.error(f"Error in run_backfill: {e}", exc_info=True)
+            status_tracker.update_quota(youtube_api.get_daily_quota_used())
+            status_tracker.publish('backfill_finished', error=str(e))
+
+
+async def start_backfill() -> bool:
+    """backfill 작업을 백그라운드로 시작합니다. 이미 실행 중이면 False를 반환합니다."""
+    global backfill_task
+    if backfill_task and not backfill_task.done():
+        return False
+    backfill_task = asyncio.create_task(run_backfill())
+    return True
+
 
+async def check_channels_now(channels) -> int:
+    """지정한 채널을 폴링 사이클과 같은 경로(조회 → 필터링 → 전송)로 즉시 확인합니다.
+
+    조회와 전송은 스레드에서 실행해 이벤트 루프를 막지 않습니다. 필터링과 전송은 notify_lock으로
+    폴링 사이클/backfill과 섞이지 않고, 모두 전송 직전에 현재 마지막 확인 시간으로
+    거르므로 중복 전송이 방지됩니다.
+
+    Returns:
+        int: 전송에 성공한 알림 수
+    """
+    notification_count = 0
+    try:
+        with tracer.span('check_now', channels=len(channels)):
+            for i in range(0, len(channels), CHANNELS_PER_REQUEST):
+                chunk = channels[i:i + CHANNELS_PER_REQUEST]
+                result = await asyncio.to_thread(
+                    youtube_api.check_new_videos_batch,
+                    since_by_channel(chunk),
+                    Config.POLL_MAX_PAGES,
+                    circuit_breakers
+                )
+                notification_count += await asyncio.to_thread(
+                    process_new_videos, chunk, result, get_current_utc()
+                )
     finally:
-        if is_running:
-            await asyncio.sleep(Config.CHECK_INTERVAL)
-            asyncio.create_task(check_new_videos())
+        status_tracker.update_quota(youtube_api.get_daily_quota_used())
+
+    logger.info(f"Checked {len(channels)} channels on demand. Sent {notification_count} notifications.")
+    return notification_count
+
+
+async def run_check_now(key, channels):
+    """대상별 단일 실행과 cooldown을 적용해 즉시 확인을 실행합니다."""
+    try:
+        notification_count, joined = await check_now_flight.run(key, lambda: check_channels_now(channels))
+    except CooldownActive as e:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Checked recently, retry after {math.ceil(e.retry_after)} seconds",
+            headers={'Retry-After': str(math.ceil(e.retry_after))}
+        )
+    except Exception as e:
+        logger.error(f"Error checking {key} on demand: {e}")
+        raise HTTPException(status_code=502, detail=f"Failed to check channels: {str(e)}")
+
+    return {
+        'status': 'joined' if joined else 'checked',
+        'channels': len(channels),
+        'notifications': notification_count
+    }
+
+
+def update_channel_health(channels, result: ChannelCheckResult):
+    """조회 결과로 채널의 휴면 상태를 갱신합니다.
+
+    channels.list 응답에서 누락되었거나 404가 반환된 채널만 누락으로 셉니다.
+    breaker가 열려 건너뛰었거나 일시적인 오류로 결과를 얻지 못한 채널은 상태를 변경하지 않습니다.
+    """
+    missed = [ch.yt_channel_id for ch in channels if ch.yt_channel_id in result.missing]
+    healthy = [ch.yt_channel_id for ch in channels if ch.yt_channel_id in result.checked]
+
+    next_probe_at = get_current_utc() + timedelta(seconds=Config.DORMANT_RECHECK_INTERVAL)
+    parked = db.mark_channels_missed(missed, Config.DORMANT_MISS_THRESHOLD, next_probe_at)
+    reset, revived = db.reactivate_channels(healthy)
+    channel_registry.park(missed, parked, next_probe_at)
+    channel_registry.reactivate(healthy)
+
+    for yt_channel_id in parked:
+        logger.warning("Channel %s marked dormant after repeated failures", yt_channel_id,
+                       extra={'channel_id': yt_channel_id})
+        status_tracker.publish('channel_status_changed', yt_channel_id=yt_channel_id, status='dormant')
+    for yt_channel_id in revived:
+        logger.info("Dormant channel %s is reachable again, reactivated", yt_channel_id,
+                    extra={'channel_id': yt_channel_id})
+        status_tracker.publish('channel_status_changed', yt_channel_id=yt_channel_id, status='active')
+    # 채널 상태가 바뀐 경우 (update_at 포함) 캐시된 채널 목록 응답을 무효화
+    if missed or reset:
+        response_cache.invalidate('channels')
+
+
+scheduler = PollScheduler(
+    poll_cycle,
+    interval=Config.CHECK_INTERVAL,
+    deadline=Config.CYCLE_DEADLINE,
+    jitter=Config.POLL_JITTER
+)
 
 
-async def start_background_task():
-    """백그라운드 작업을 시작합니다."""
-    global is_running, background_task
-    if not is_running:
-        is_running = True
-        background_task = asyncio.create_task(check_new_videos())
+async def start_background_task() -> bool:
+    """백그라운드 작업을 시작합니다. 이미 실행 중이면 False를 반환합니다."""
+    started = scheduler.start()
+    if started:
+        status_tracker.publish('background_started')
         logger.info("Background task started")
+    return started
+
 
+async def stop_background_task(drain: bool = True) -> bool:
+    """백그라운드 작업을 중지합니다.
 
-async def stop_background_task():
-    """백그라운드 작업을 중지합니다."""
-    global is_running, background_task
-    if is_running:
-        is_running = False
-        if background_task:
-            background_task.cancel()
+    Args:
+        drain: True면 진행 중인 사이클이 끝날 때까지 기다린 후 중지
+    """
+    stopped = await scheduler.stop(drain=drain, timeout=Config.DRAIN_TIMEOUT)
+    if stopped:
+        status_tracker.publish('background_stopped')
         logger.info("Background task stopped")
+    return stopped
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시
+    status_tracker.update_quota(youtube_api.get_daily_quota_used())
+    if Config.BACKFILL_ON_STARTUP:
+        await start_backfill()
     await start_background_task()
     yield
     # 종료 시
     await stop_background_task()
+    status_tracker.close()
+    tracer.shutdown()
 
 
 # FastAPI 애플리케이션 생성
@@ -150,6 +490,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 app.include_router(api_router, prefix="/api/v1")
@@ -161,24 +502,44 @@ async def root():
 # 서비스 상태 확인 엔드포인트
 @app.get("/status")
 async def get_status():
-    return {
-        "status": "running",
-        "background_task_running": is_running,
-        "youtube_api_quota_used": youtube_api.get_daily_quota_used()
-    }
+    return status_tracker.status()
 
 
 # 백그라운드 작업 제어 엔드포인트
 @app.post("/background/start")
 async def start_task():
-    await start_background_task()
-    return {"status": "started"}
+    started = await start_background_task()
+    return {"status": "started" if started else "already_running"}
 
 
 @app.post("/background/stop")
-async def stop_task():
-    await stop_background_task()
-    return {"status": "stopped"}
+async def stop_task(drain: bool = True):
+    stopped = await stop_background_task(drain=drain)
+    return {"status": "stopped" if stopped else "not_running"}
+
+
+@app.post("/background/backfill")
+async def backfill_task_start():
+    started = await start_backfill()
+    return {"status": "started" if started else "already_running"}
+
+
+@app.post("/background/check/channels/{channel_id}")
+async def check_channel_now(channel_id: int):
+    """채널 하나를 즉시 확인합니다."""
+    record = channel_registry.get(channel_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Channel not found")
+    return await run_check_now(('channel', channel_id), [record])
+
+
+@app.post("/background/check/webhooks/{webhook_id}")
+async def check_webhook_channels_now(webhook_id: int):
+    """웹훅에 연결된 채널을 모두 즉시 확인합니다."""
+    channels = channel_registry.get_by_webhook(webhook_id)
+    if not channels:
+        raise HTTPException(status_code=404, detail="No channels registered for this webhook")
+    return await run_check_now(('webhook', webhook_id), channels)
 
 
 if __name__ == "__main__":
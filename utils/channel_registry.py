@@ -0,0 +1,179 @@
+# utils/channel_registry.py
+import logging
+import math
+import sys
+import threading
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Union
+from utils.db_manager import DatabaseManager, Channel
+from utils.time_utils import to_utc
+
+logger = logging.getLogger(__name__)
+
+# next_probe_at 배열 값: 활성 채널은 0, 재확인 시각이 없는 휴면 채널은 inf
+ACTIVE = 0.0
+NEVER = math.inf
+
+
+class ChannelRecord:
+    """폴링에 필요한 채널 정보만 담는 레코드입니다. (slot은 상태 배열의 인덱스)"""
+    __slots__ = ('id', 'webhook_id', 'yt_channel_id', 'slot')
+
+    def __init__(self, id: int, webhook_id: int, yt_channel_id: str, slot: int):
+        self.id = id
+        self.webhook_id = webhook_id
+        self.yt_channel_id = yt_channel_id
+        self.slot = slot
+
+
+def _timestamp(value: Optional[Union[str, datetime]], default: float) -> float:
+    return to_utc(value).timestamp() if value else default
+
+
+class ChannelRegistry:
+    """폴링 대상 채널을 메모리에 유지하는 레지스트리입니다.
+
+    - 채널은 __slots__ 레코드로 보관하고 YouTube 채널 ID는 sys.intern으로 공유합니다.
+    - 마지막 확인 시각과 다음 재확인 시각은 slot 인덱스로 접근하는 array('d')에 저장합니다.
+    - 시작 시 DB에서 한 번 적재한 뒤, 채널 등록/삭제 API와 폴링 사이클이 변경 사항을 반영합니다.
+      DB가 원본이며, 레지스트리는 사이클마다 채널 전체를 다시 읽지 않기 위한 사본입니다.
+    """
+
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """DB에서 채널 전체를 다시 적재합니다."""
+        records: List[Optional[ChannelRecord]] = []
+        last_check = array('d')
+        next_probe = array('d')
+        for row in self.db.get_channel_registry_rows():
+            records.append(ChannelRecord(
+                row['id'], row['webhook_id'], sys.intern(row['yt_channel_id']), len(records)
+            ))
+            last_check.append(_timestamp(row['last_check_at'], 0.0))
+            next_probe.append(
+                ACTIVE if row['status'] == 'active' else _timestamp(row['next_probe_at'], NEVER)
+            )
+
+        with self._lock:
+            self._records = records
+            self._last_check = last_check
+            self._next_probe = next_probe
+            self._free: List[int] = []
+            self._by_id: Dict[int, ChannelRecord] = {}
+            self._slots_by_yt: Dict[str, Union[int, Tuple[int, ...]]] = {}
+            for record in records:
+                self._index(record)
+        logger.info(f"Channel registry loaded with {len(records)} channels")
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def add(self, channel: Channel):
+        """등록된 채널을 레지스트리에 추가합니다."""
+        with self._lock:
+            if channel.id in self._by_id:
+                return
+            last_check = _timestamp(channel.last_check_at, 0.0)
+            next_probe = ACTIVE if channel.status == 'active' else _timestamp(channel.next_probe_at, NEVER)
+            if self._free:
+                slot = self._free.pop()
+                self._last_check[slot] = last_check
+                self._next_probe[slot] = next_probe
+            else:
+                slot = len(self._records)
+                self._records.append(None)
+                self._last_check.append(last_check)
+                self._next_probe.append(next_probe)
+
+            record = ChannelRecord(
+                channel.id, channel.webhook_id, sys.intern(channel.yt_channel_id), slot
+            )
+            self._records[slot] = record
+            self._index(record)
+
+    def remove(self, channel_id: int) -> bool:
+        """삭제된 채널을 레지스트리에서 제거합니다. slot은 재사용을 위해 보관합니다."""
+        with self._lock:
+            record = self._by_id.pop(channel_id, None)
+            if record is None:
+                return False
+            slots = tuple(s for s in self._slots_of(record.yt_channel_id) if s != record.slot)
+            if not slots:
+                del self._slots_by_yt[record.yt_channel_id]
+            else:
+                self._slots_by_yt[record.yt_channel_id] = slots[0] if len(slots) == 1 else slots
+            self._records[record.slot] = None
+            self._free.append(record.slot)
+            return True
+
+    def get(self, channel_id: int) -> Optional[ChannelRecord]:
+        return self._by_id.get(channel_id)
+
+    def get_by_webhook(self, webhook_id: int) -> List[ChannelRecord]:
+        """웹훅에 연결된 레코드 목록을 반환합니다."""
+        return [r for r in self._records if r is not None and r.webhook_id == webhook_id]
+
+    def pollable(self, now: Optional[datetime] = None) -> List[ChannelRecord]:
+        """폴링 대상 레코드를 등록 순서대로 반환합니다.
+
+        활성 채널과, 재확인 시각(next_probe_at)이 지난 휴면 채널만 반환합니다.
+        """
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        with self._lock:
+            return [
+                record for record, probe_at in zip(self._records, self._next_probe)
+                if probe_at <= now_ts and record is not None
+            ]
+
+    def last_check_at(self, record: ChannelRecord) -> datetime:
+        """레코드의 마지막 확인 시각(UTC)을 반환합니다."""
+        return datetime.fromtimestamp(self._last_check[record.slot], timezone.utc)
+
+    def set_last_check(self, yt_channel_id: str, check_time: datetime):
+        """채널의 마지막 확인 시각을 갱신합니다."""
+        ts = to_utc(check_time).timestamp()
+        with self._lock:
+            for slot in self._slots_of(yt_channel_id):
+                self._last_check[slot] = ts
+
+    def park(self, yt_channel_ids: List[str], parked: List[str], next_probe_at: datetime):
+        """조회에 실패한 채널의 재확인 시각을 반영합니다.
+
+        새로 휴면 처리된 채널(parked)과 이미 휴면 상태인 채널의 재확인 시각을 next_probe_at으로 설정합니다.
+        (DatabaseManager.mark_channels_missed와 같은 규칙)
+        """
+        ts = to_utc(next_probe_at).timestamp()
+        parked = set(parked)
+        with self._lock:
+            for yt_channel_id in yt_channel_ids:
+                for slot in self._slots_of(yt_channel_id):
+                    if yt_channel_id in parked or self._next_probe[slot] != ACTIVE:
+                        self._next_probe[slot] = ts
+
+    def reactivate(self, yt_channel_ids: List[str]):
+        """정상 조회된 채널을 활성 상태로 표시합니다."""
+        with self._lock:
+            for yt_channel_id in yt_channel_ids:
+                for slot in self._slots_of(yt_channel_id):
+                    self._next_probe[slot] = ACTIVE
+
+    def _index(self, record: ChannelRecord):
+        self._by_id[record.id] = record
+        existing = self._slots_by_yt.get(record.yt_channel_id)
+        if existing is None:
+            self._slots_by_yt[record.yt_channel_id] = record.slot
+        else:
+            # 같은 YouTube 채널이 여러 웹훅에 등록된 경우에만 tuple로 보관
+            self._slots_by_yt[record.yt_channel_id] = self._slots_of(record.yt_channel_id) + (record.slot,)
+
+    def _slots_of(self, yt_channel_id: str) -> Tuple[int, ...]:
+        slots = self._slots_by_yt.get(yt_channel_id, ())
+        return (slots,) if isinstance(slots, int) else slots
+
+
+channel_registry = ChannelRegistry(DatabaseManager())
@@ -0,0 +1,154 @@
+# utils/circuit_breaker.py
+import logging
+import threading
+import time
+from typing import Dict, List, Tuple
+from utils.config import Config
+from utils.db_manager import DatabaseManager, CircuitBreakerState
+from utils.status_tracker import status_tracker
+from utils.time_utils import get_current_utc, format_utc, to_utc
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# 대상 종류
+WEBHOOK = 'webhook'
+CHANNEL = 'channel'
+
+
+class CircuitBreakerRegistry:
+    """웹훅/채널별 circuit breaker를 관리합니다.
+
+    연속 실패가 failure_threshold에 도달하면 open 상태가 되어 호출을 건너뛰고,
+    recovery_timeout이 지나면 half_open 상태에서 한 번의 시험 호출(probe)을 허용합니다.
+    probe가 성공하면 closed로 복구되고, 실패하면 다시 open 상태가 됩니다.
+    상태는 DB에 저장되어 재시작 후에도 유지됩니다.
+    """
+
+    def __init__(self, db: DatabaseManager, failure_threshold: int, recovery_timeout: int):
+        self.db = db
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._breakers: Dict[Tuple[str, str], CircuitBreakerState] = {
+            (b.kind, b.key): b for b in db.get_circuit_breakers()
+        }
+        # half_open 상태에서 진행 중인 probe 시작 시각 (메모리에만 보관)
+        self._probes: Dict[Tuple[str, str], float] = {}
+        status_tracker.publish('circuit_breaker_changed', open_count=self.open_count())
+
+    def allow(self, kind: str, key: str) -> bool:
+        """해당 대상 호출을 허용할지 반환합니다."""
+        with self._lock:
+            breaker = self._breakers.get((kind, key))
+            if breaker is None or breaker.state == CLOSED:
+                return True
+
+            now = time.time()
+            if breaker.state == OPEN:
+                opened_at = to_utc(breaker.opened_at).timestamp() if breaker.opened_at else 0
+                if now - opened_at < self.recovery_timeout:
+                    return False
+                breaker.state = HALF_OPEN
+                self._save(breaker)
+                logger.info(f"Circuit breaker half-open: {kind}/{key}")
+
+            # half_open: 동시에 하나의 probe만 허용 (오래된 probe는 만료 처리)
+            probe_started = self._probes.get((kind, key))
+            if probe_started is not None and now - probe_started < self.recovery_timeout:
+                return False
+            self._probes[(kind, key)] = now
+            return True
+
+    def record_success(self, kind: str, key: str):
+        """호출 성공을 기록합니다. 실패 이력이 있으면 closed로 초기화합니다."""
+        with self._lock:
+            self._probes.pop((kind, key), None)
+            breaker = self._breakers.pop((kind, key), None)
+            if breaker is None:
+                return
+            self.db.delete_circuit_breaker(kind, key)
+            if breaker.state != CLOSED:
+                logger.info(f"Circuit breaker closed: {kind}/{key}")
+                self._notify(kind, key, CLOSED)
+
+    def record_failure(self, kind: str, key: str, error: str, trip: bool = False):
+        """호출 실패를 기록합니다.
+
+        Args:
+            kind: 대상 종류 (webhook, channel)
+            key: 대상 ID
+            error: 실패 사유
+            trip: True면 실패 횟수와 관계없이 즉시 open (영구 오류 등)
+        """
+        with self._lock:
+            self._probes.pop((kind, key), None)
+            breaker = self._breakers.get((kind, key))
+            if breaker is None:
+                breaker = CircuitBreakerState(
+                    kind=kind, key=key, state=CLOSED, failure_count=0,
+                    opened_at=None, last_error=None, update_at=format_utc(get_current_utc())
+                )
+                self._breakers[(kind, key)] = breaker
+
+            breaker.failure_count += 1
+            breaker.last_error = error[:500]
+            should_open = (
+                breaker.state == HALF_OPEN
+                or trip
+                or breaker.failure_count >= self.failure_threshold
+            )
+            if should_open:
+                was_open = breaker.state == OPEN
+                breaker.state = OPEN
+                breaker.opened_at = format_utc(get_current_utc())
+                if not was_open:
+                    logger.warning(
+                        f"Circuit breaker opened: {kind}/{key} "
+                        f"after {breaker.failure_count} failures - {error}"
+                    )
+            self._save(breaker)
+            if should_open:
+                self._notify(kind, key, OPEN)
+
+    def reset(self, kind: str, key: str):
+        """대상이 삭제된 경우 등 breaker 상태를 제거합니다."""
+        with self._lock:
+            self._probes.pop((kind, key), None)
+            if self._breakers.pop((kind, key), None) is not None:
+                self.db.delete_circuit_breaker(kind, key)
+                self._notify(kind, key, CLOSED)
+
+    def open_count(self) -> int:
+        return sum(1 for b in self._breakers.values() if b.state != CLOSED)
+
+    def list_breakers(self) -> List[CircuitBreakerState]:
+        """실패 이력이 있는 모든 breaker 상태를 반환합니다."""
+        with self._lock:
+            return sorted(self._breakers.values(), key=lambda b: (b.kind, b.key))
+
+    def _save(self, breaker: CircuitBreakerState):
+        breaker.update_at = format_utc(get_current_utc())
+        self.db.save_circuit_breaker(
+            breaker.kind, breaker.key, breaker.state, breaker.failure_count,
+            breaker.opened_at, breaker.last_error
+        )
+
+    def _notify(self, kind: str, key: str, state: str):
+        status_tracker.publish(
+            'circuit_breaker_changed',
+            kind=kind,
+            key=key,
+            state=state,
+            open_count=self.open_count()
+        )
+
+
+circuit_breakers = CircuitBreakerRegistry(
+    DatabaseManager(),
+    failure_threshold=Config.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=Config.CIRCUIT_BREAKER_RECOVERY_TIMEOUT
+)
@@ -15,4 +15,50 @@ class Config:
     YOUTUBE_API = YouTubeAPI.initialize(YOUTUBE_API_KEY)
 
     # 새 영상 체크 간격 (기본 30분)
-    CHECK_INTERVAL = int(os.getenv('CHECK_INTERVAL', '1800'))
\ No newline at end of file
+    CHECK_INTERVAL = int(os.getenv('CHECK_INTERVAL', '1800'))
+
+    # 폴링 시 채널당 최대 조회 페이지 수 (마지막 확인 시간 이후 동영상이 한 페이지(50개)를 넘는 경우)
+    POLL_MAX_PAGES = int(os.getenv('POLL_MAX_PAGES', '2'))
+
+    # 사이클 제한 시간 (기본: 체크 간격의 80%), tick 대기 jitter(초), 중지 시 진행 중 사이클 대기 시간(초)
+    CYCLE_DEADLINE = float(os.getenv('CYCLE_DEADLINE', str(CHECK_INTERVAL * 0.8)))
+    POLL_JITTER = float(os.getenv('POLL_JITTER', '5'))
+    DRAIN_TIMEOUT = float(os.getenv('DRAIN_TIMEOUT', '60'))
+
+    # Circuit breaker 설정 (연속 실패 횟수, open 상태 유지 시간(초))
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_BREAKER_FAILURE_THRESHOLD', '3'))
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT = int(os.getenv('CIRCUIT_BREAKER_RECOVERY_TIMEOUT', '7200'))
+
+    # 휴면 채널 설정 (휴면 전환 기준 연속 실패 사이클 수, 휴면 채널 재확인 간격(초))
+    DORMANT_MISS_THRESHOLD = int(os.getenv('DORMANT_MISS_THRESHOLD', '6'))
+    DORMANT_RECHECK_INTERVAL = int(os.getenv('DORMANT_RECHECK_INTERVAL', '86400'))
+
+    # Backfill 설정 (시작 시 자동 실행 여부, 채널당 최대 조회 페이지 수, 동시 조회 채널 수)
+    BACKFILL_ON_STARTUP = os.getenv('BACKFILL_ON_STARTUP', 'true').lower() == 'true'
+    BACKFILL_MAX_PAGES = int(os.getenv('BACKFILL_MAX_PAGES', '4'))
+    BACKFILL_CONCURRENCY = int(os.getenv('BACKFILL_CONCURRENCY', '8'))
+
+    # 알림 이력/통계 보관 기간 (일)
+    NOTIFICATION_RETENTION_DAYS = int(os.getenv('NOTIFICATION_RETENTION_DAYS', '30'))
+
+    # 즉시 확인 요청 후 같은 대상을 다시 확인할 수 있을 때까지의 대기 시간(초)
+    CHECK_NOW_COOLDOWN = int(os.getenv('CHECK_NOW_COOLDOWN', '300'))
+
+    # 로깅 설정 (레벨, 출력 형식(json, text), 채널/웹훅별 반복 오류 로그 허용 개수와 window(초))
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'json').lower()
+    LOG_ERROR_BURST = int(os.getenv('LOG_ERROR_BURST', '5'))
+    LOG_ERROR_WINDOW = float(os.getenv('LOG_ERROR_WINDOW', '60'))
+
+    # 프로파일링 설정 (결과 저장 디렉터리, sampling 모드 샘플링 간격(초))
+    PROFILE_DIR = os.getenv('PROFILE_DIR', 'profiles')
+    PROFILE_SAMPLE_INTERVAL = float(os.getenv('PROFILE_SAMPLE_INTERVAL', '0.005'))
+
+    # 트레이싱 설정 (내보내기 방식(none, jsonl, otlp), trace 샘플링 비율, JSONL 파일 경로, OTLP/HTTP 엔드포인트)
+    TRACING_EXPORTER = os.getenv('TRACING_EXPORTER', 'none').lower()
+    TRACING_SAMPLE_RATIO = float(os.getenv('TRACING_SAMPLE_RATIO', '1.0'))
+    TRACING_JSONL_PATH = os.getenv('TRACING_JSONL_PATH', 'traces.jsonl')
+    TRACING_OTLP_ENDPOINT = os.getenv('TRACING_OTLP_ENDPOINT', 'http://localhost:4318/v1/traces')
+
+    # 이벤트 스트림(SSE) 연결 최대 유지 시간(초). 지나면 스트림을 끝내고 클라이언트가 다시 연결함 (서버 종료 지연 방지)
+    EVENT_STREAM_MAX_DURATION = float(os.getenv('EVENT_STREAM_MAX_DURATION', '60'))
\ No newline at end of file
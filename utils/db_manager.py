@@ -1,14 +1,38 @@
 # utils/db_manager.py
 import sqlite3
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from dataclasses import dataclass
 import logging
 from contextlib import contextmanager
 from utils.time_utils import to_utc, get_current_utc, format_utc
+from utils.tracing import trace_query
 
 logger = logging.getLogger(__name__)
 
+# 감지 지연 시간 히스토그램 구간 상한 (초). 마지막 구간(lag_b9)은 상한 없음
+LAG_BUCKET_BOUNDS = [60, 300, 900, 1800, 3600, 7200, 14400, 43200, 86400]
+LAG_BUCKET_COLUMNS = [f"lag_b{i}" for i in range(len(LAG_BUCKET_BOUNDS) + 1)]
+
+# 전체 채널 합계를 저장하는 rollup 키
+ALL_CHANNELS = '*'
+
+# IN 절 하나에 넣을 최대 파라미터 수 (SQLite 변수 개수 제한 이하)
+IN_CLAUSE_CHUNK = 500
+
+
+def _lag_bucket(lag_seconds: float) -> int:
+    """감지 지연 시간이 속하는 히스토그램 구간 번호를 반환합니다."""
+    for i, bound in enumerate(LAG_BUCKET_BOUNDS):
+        if lag_seconds <= bound:
+            return i
+    return len(LAG_BUCKET_BOUNDS)
+
+
+def _escape_like(value: str) -> str:
+    """LIKE 패턴에서 와일드카드 문자를 이스케이프합니다."""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
 
 @dataclass
 class Webhook:
@@ -30,6 +54,43 @@ class Channel:
     last_check_at: str
     create_at: str
     update_at: str
+    status: str = 'active'
+    miss_count: int = 0
+    next_probe_at: Optional[str] = None
+
+
+@dataclass
+class NotificationLog:
+    id: int
+    video_id: str
+    yt_channel_id: str
+    webhook_id: Optional[int]
+    published_at: str
+    detected_at: str
+    sent_at: Optional[str]
+    status: str
+
+
+@dataclass
+class NotificationStatsDaily:
+    yt_channel_id: str
+    day: str
+    sent_count: int
+    failed_count: int
+    lag_count: int
+    lag_sum_seconds: float
+    lag_buckets: List[int]
+
+
+@dataclass
+class CircuitBreakerState:
+    kind: str
+    key: str
+    state: str
+    failure_count: int
+    opened_at: Optional[str]
+    last_error: Optional[str]
+    update_at: str
 
 
 class DatabaseManager:
@@ -76,15 +137,63 @@ class DatabaseManager:
                     last_check_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                     create_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                     update_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    status TEXT NOT NULL DEFAULT 'active',
+                    miss_count INTEGER NOT NULL DEFAULT 0,
+                    next_probe_at TIMESTAMP,
                     FOREIGN KEY (webhook_id) REFERENCES webhook(webhook_id)
                 )
                 """,
 
+                # circuit_breaker 테이블 생성
+                """
+                CREATE TABLE IF NOT EXISTS circuit_breaker (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    failure_count INTEGER NOT NULL DEFAULT 0,
+                    opened_at TIMESTAMP,
+                    last_error TEXT,
+                    update_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (kind, key)
+                )
+                """,
+
+                # notification_log 테이블 생성 (append-only)
+                """
+                CREATE TABLE IF NOT EXISTS notification_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    video_id TEXT NOT NULL,
+                    yt_channel_id TEXT NOT NULL,
+                    webhook_id INTEGER,
+                    published_at TIMESTAMP NOT NULL,
+                    detected_at TIMESTAMP NOT NULL,
+                    sent_at TIMESTAMP,
+                    status TEXT NOT NULL
+                )
+                """,
+
+                # 채널별/일별 알림 통계 rollup 테이블 생성
+                f"""
+                CREATE TABLE IF NOT EXISTS notification_stats_daily (
+                    yt_channel_id TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    sent_count INTEGER NOT NULL DEFAULT 0,
+                    failed_count INTEGER NOT NULL DEFAULT 0,
+                    lag_count INTEGER NOT NULL DEFAULT 0,
+                    lag_sum_seconds REAL NOT NULL DEFAULT 0,
+                    {', '.join(f'{col} INTEGER NOT NULL DEFAULT 0' for col in LAG_BUCKET_COLUMNS)},
+                    PRIMARY KEY (yt_channel_id, day)
+                )
+                """,
+
                 # 인덱스 생성
                 "CREATE INDEX IF NOT EXISTS idx_webhook_name ON webhook(webhook_name)",
                 "CREATE INDEX IF NOT EXISTS idx_yt_channel_id ON channel(yt_channel_id)",
                 "CREATE INDEX IF NOT EXISTS idx_yt_handling_id ON channel(yt_handling_id)",
                 "CREATE INDEX IF NOT EXISTS idx_last_check_at ON channel(last_check_at)",
+                "CREATE INDEX IF NOT EXISTS idx_notification_log_detected_at ON notification_log(detected_at)",
+                "CREATE INDEX IF NOT EXISTS idx_notification_log_channel ON notification_log(yt_channel_id, id)",
+                "CREATE INDEX IF NOT EXISTS idx_notification_stats_day ON notification_stats_daily(day)",
 
                 # webhook 테이블 트리거
                 """
@@ -111,8 +220,25 @@ class DatabaseManager:
             for command in sql_commands:
                 cursor.execute(command.strip())
 
+            self._migrate_channel_table(cursor)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_channel_status ON channel(status, next_probe_at)")
+
             conn.commit()
 
+    def _migrate_channel_table(self, cursor: sqlite3.Cursor):
+        """기존 DB의 channel 테이블에 휴면 관리 컬럼을 추가합니다."""
+        cursor.execute("PRAGMA table_info(channel)")
+        columns = {row['name'] for row in cursor.fetchall()}
+        migrations = {
+            'status': "ALTER TABLE channel ADD COLUMN status TEXT NOT NULL DEFAULT 'active'",
+            'miss_count': "ALTER TABLE channel ADD COLUMN miss_count INTEGER NOT NULL DEFAULT 0",
+            'next_probe_at': "ALTER TABLE channel ADD COLUMN next_probe_at TIMESTAMP",
+        }
+        for column, command in migrations.items():
+            if column not in columns:
+                cursor.execute(command)
+
+    @trace_query
     def add_webhook(self, workspace_name: str, webhook_name: str, url: str) -> int:
         """새로운 웹훅을 추가합니다."""
         with self.get_connection() as conn:
@@ -124,6 +250,7 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
 
+    @trace_query
     def get_webhook(self, webhook_id: int) -> Optional[Webhook]:
         """특정 웹훅 정보를 조회합니다."""
         with self.get_connection() as conn:
@@ -134,6 +261,7 @@ class DatabaseManager:
                 return Webhook(**dict(row))
             return None
 
+    @trace_query
     def get_all_webhooks(self) -> List[Webhook]:
         """모든 웹훅 목록을 조회합니다."""
         with self.get_connection() as conn:
@@ -141,6 +269,31 @@ class DatabaseManager:
             cursor.execute("SELECT * FROM webhook ORDER BY webhook_id")
             return [Webhook(**dict(row)) for row in cursor.fetchall()]
 
+    @trace_query
+    def get_webhooks_page(self, after_id: int = 0, limit: int = 100,
+                          name: Optional[str] = None) -> List[Webhook]:
+        """웹훅 목록을 키셋 방식으로 페이지 단위 조회합니다.
+
+        Args:
+            after_id: 이 webhook_id 다음부터 조회 (커서)
+            limit: 최대 조회 개수
+            name: 워크스페이스/웹훅 이름 부분 일치 필터
+        """
+        query = "SELECT * FROM webhook WHERE webhook_id > ?"
+        params: list = [after_id]
+        if name:
+            pattern = f"%{_escape_like(name)}%"
+            query += " AND (webhook_name LIKE ? ESCAPE '\\' OR workspace_name LIKE ? ESCAPE '\\')"
+            params.extend([pattern, pattern])
+        query += " ORDER BY webhook_id LIMIT ?"
+        params.append(limit)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [Webhook(**dict(row)) for row in cursor.fetchall()]
+
+    @trace_query
     def delete_webhook(self, webhook_id: int) -> bool:
         """웹훅을 삭제합니다."""
         with self.get_connection() as conn:
@@ -149,6 +302,7 @@ class DatabaseManager:
             conn.commit()
             return cursor.rowcount > 0
 
+    @trace_query
     def add_channel(self, webhook_id: int, yt_channel_id: str,
                    yt_handling_id: str, yt_ch_name: str) -> int:
         """새로운 채널을 추가합니다."""
@@ -168,6 +322,7 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
 
+    @trace_query
     def get_channel_by_id(self, channel_id: int) -> Optional[Channel]:
         """ID로 채널을 조회합니다."""
         with self.get_connection() as conn:
@@ -178,6 +333,7 @@ class DatabaseManager:
                 return Channel(**dict(row))
             return None
 
+    @trace_query
     def get_all_channels(self) -> List[Channel]:
         """모든 채널 목록을 조회합니다."""
         with self.get_connection() as conn:
@@ -185,6 +341,125 @@ class DatabaseManager:
             cursor.execute("SELECT * FROM channel ORDER BY id")
             return [Channel(**dict(row)) for row in cursor.fetchall()]
 
+    @trace_query
+    def get_channel_registry_rows(self) -> List[sqlite3.Row]:
+        """채널 레지스트리 적재에 필요한 컬럼만 조회합니다."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, webhook_id, yt_channel_id, last_check_at, status, next_probe_at
+                FROM channel
+                ORDER BY id
+            """)
+            return cursor.fetchall()
+
+    @trace_query
+    def get_channels_page(self, after_id: int = 0, limit: int = 100,
+                          webhook_id: Optional[int] = None,
+                          name: Optional[str] = None) -> List[Channel]:
+        """채널 목록을 키셋 방식으로 페이지 단위 조회합니다.
+
+        Args:
+            after_id: 이 id 다음부터 조회 (커서)
+            limit: 최대 조회 개수
+            webhook_id: 웹훅 ID 필터
+            name: 채널 이름/핸들링 ID 부분 일치 필터
+        """
+        query = "SELECT * FROM channel WHERE id > ?"
+        params: list = [after_id]
+        if webhook_id is not None:
+            query += " AND webhook_id = ?"
+            params.append(webhook_id)
+        if name:
+            pattern = f"%{_escape_like(name)}%"
+            query += " AND (yt_ch_name LIKE ? ESCAPE '\\' OR yt_handling_id LIKE ? ESCAPE '\\')"
+            params.extend([pattern, pattern])
+        query += " ORDER BY id LIMIT ?"
+        params.append(limit)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [Channel(**dict(row)) for row in cursor.fetchall()]
+
+    @trace_query
+    def mark_channels_missed(self, yt_channel_ids: List[str], threshold: int,
+                             next_probe_at: datetime) -> List[str]:
+        """조회에 실패한 채널의 연속 실패 횟수를 올리고, 기준을 넘으면 휴면 처리합니다.
+
+        Args:
+            yt_channel_ids: 이번 사이클에서 결과를 얻지 못한 채널 ID 목록
+            threshold: 휴면 전환 기준 연속 실패 횟수
+            next_probe_at: 휴면 채널의 다음 재확인 시각
+
+        Returns:
+            List[str]: 이번에 새로 휴면 처리된 채널 ID 목록
+        """
+        if not yt_channel_ids:
+            return []
+        probe_at = format_utc(to_utc(next_probe_at))
+        params = [(cid,) for cid in yt_channel_ids]
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "UPDATE channel SET miss_count = miss_count + 1 WHERE yt_channel_id = ?",
+                params
+            )
+            # 이미 휴면 상태인 채널은 재확인 시각만 뒤로 미룸
+            cursor.executemany(
+                "UPDATE channel SET next_probe_at = ? WHERE yt_channel_id = ? AND status = 'dormant'",
+                [(probe_at, cid) for cid in yt_channel_ids]
+            )
+            parked = self._select_channel_ids(
+                cursor, "status = 'active' AND miss_count >= ?", (threshold,), yt_channel_ids
+            )
+            cursor.executemany(
+                "UPDATE channel SET status = 'dormant', next_probe_at = ? WHERE yt_channel_id = ?",
+                [(probe_at, cid) for cid in parked]
+            )
+            conn.commit()
+            return parked
+
+    @trace_query
+    def reactivate_channels(self, yt_channel_ids: List[str]) -> Tuple[List[str], List[str]]:
+        """정상 조회된 채널의 실패 이력을 초기화하고 휴면 채널을 활성화합니다.
+
+        Returns:
+            Tuple[List[str], List[str]]: (실패 이력이 초기화된 채널 ID 목록, 그중 휴면 상태에서 다시 활성화된 채널 ID 목록)
+        """
+        if not yt_channel_ids:
+            return [], []
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            reset = self._select_channel_ids(
+                cursor, "(miss_count > 0 OR status != 'active')", (), yt_channel_ids
+            )
+            if not reset:
+                return [], []
+            revived = self._select_channel_ids(cursor, "status = 'dormant'", (), reset)
+            cursor.executemany(
+                "UPDATE channel SET status = 'active', miss_count = 0, next_probe_at = NULL WHERE yt_channel_id = ?",
+                [(cid,) for cid in reset]
+            )
+            conn.commit()
+            return reset, revived
+
+    @staticmethod
+    def _select_channel_ids(cursor, condition: str, params: tuple, yt_channel_ids: List[str]) -> List[str]:
+        """주어진 채널 ID 중 조건을 만족하는 채널 ID를 조회합니다."""
+        unique_ids = list(dict.fromkeys(yt_channel_ids))
+        selected = []
+        for i in range(0, len(unique_ids), IN_CLAUSE_CHUNK):
+            chunk = unique_ids[i:i + IN_CLAUSE_CHUNK]
+            cursor.execute(
+                f"SELECT DISTINCT yt_channel_id FROM channel WHERE {condition} "
+                f"AND yt_channel_id IN ({','.join('?' * len(chunk))})",
+                (*params, *chunk)
+            )
+            selected.extend(row['yt_channel_id'] for row in cursor.fetchall())
+        return selected
+
+    @trace_query
     def get_channels_by_webhook(self, webhook_id: int) -> List[Channel]:
         """특정 웹훅에 등록된 채널 목록을 조회합니다."""
         with self.get_connection() as conn:
@@ -192,6 +467,7 @@ class DatabaseManager:
             cursor.execute("SELECT * FROM channel WHERE webhook_id = ?", (webhook_id,))
             return [Channel(**dict(row)) for row in cursor.fetchall()]
 
+    @trace_query
     def get_channel_by_handling_id(self, yt_handling_id: str) -> Optional[Channel]:
         """핸들링 ID로 채널을 조회합니다."""
         with self.get_connection() as conn:
@@ -202,6 +478,7 @@ class DatabaseManager:
                 return Channel(**dict(row))
             return None
 
+    @trace_query
     def delete_channel(self, channel_id: int) -> bool:
         """채널을 삭제합니다."""
         with self.get_connection() as conn:
@@ -210,6 +487,7 @@ class DatabaseManager:
             conn.commit()
             return cursor.rowcount > 0
 
+    @trace_query
     def update_last_check_time(self, yt_channel_id: str, check_time: Optional[datetime] = None) -> bool:
         """채널의 마지막 확인 시간을 업데이트합니다. (UTC 기준)"""
         if check_time is None:
@@ -227,6 +505,7 @@ class DatabaseManager:
             conn.commit()
             return cursor.rowcount > 0
 
+    @trace_query
     def get_last_check_time(self, yt_channel_id: str) -> datetime:
         """채널의 마지막 확인 시간을 조회합니다. (UTC 기준)"""
         with self.get_connection() as conn:
@@ -241,6 +520,7 @@ class DatabaseManager:
                 return to_utc(row['last_check_at'])
             return get_current_utc()  # 기본값으로 현재 UTC 시간 반환
 
+    @trace_query
     def get_channel_by_yt_channel_id(self, yt_channel_id: str) -> Optional[Channel]:
         """YouTube 채널 ID로 채널을 조회합니다."""
         with self.get_connection() as conn:
@@ -252,4 +532,171 @@ class DatabaseManager:
             row = cursor.fetchone()
             if row:
                 return Channel(**dict(row))
-            return None
\ No newline at end of file
+            return None
+
+    @trace_query
+    def get_circuit_breakers(self) -> List[CircuitBreakerState]:
+        """저장된 모든 circuit breaker 상태를 조회합니다."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM circuit_breaker ORDER BY kind, key")
+            return [CircuitBreakerState(**dict(row)) for row in cursor.fetchall()]
+
+    @trace_query
+    def save_circuit_breaker(self, kind: str, key: str, state: str, failure_count: int,
+                             opened_at: Optional[str], last_error: Optional[str]):
+        """circuit breaker 상태를 저장합니다. (없으면 추가, 있으면 갱신)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO circuit_breaker (
+                    kind, key, state, failure_count, opened_at, last_error, update_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (kind, key) DO UPDATE SET
+                    state = excluded.state,
+                    failure_count = excluded.failure_count,
+                    opened_at = excluded.opened_at,
+                    last_error = excluded.last_error,
+                    update_at = excluded.update_at
+            """, (
+                kind, key, state, failure_count, opened_at, last_error,
+                format_utc(get_current_utc())
+            ))
+            conn.commit()
+
+    @trace_query
+    def delete_circuit_breaker(self, kind: str, key: str) -> bool:
+        """circuit breaker 상태를 삭제합니다."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM circuit_breaker WHERE kind = ? AND key = ?",
+                (kind, key)
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+
+    @trace_query
+    def record_notification(self, video_id: str, yt_channel_id: str, webhook_id: Optional[int],
+                            published_at: datetime, detected_at: datetime,
+                            sent_at: Optional[datetime], status: str) -> int:
+        """알림 이력을 추가하고 채널별/전체 일별 통계를 같은 트랜잭션에서 갱신합니다.
+
+        감지 지연 시간 통계는 전송에 성공한 알림만 반영하므로, 재시도된 동영상도 한 번만 집계됩니다.
+
+        Args:
+            status: 'sent' 또는 'failed'
+
+        Returns:
+            int: 추가된 이력 ID
+        """
+        published_at = to_utc(published_at)
+        detected_at = to_utc(detected_at)
+        lag_seconds = max(0.0, (detected_at - published_at).total_seconds())
+        bucket_column = LAG_BUCKET_COLUMNS[_lag_bucket(lag_seconds)]
+        day = detected_at.date().isoformat()
+        sent = 1 if status == 'sent' else 0
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO notification_log (
+                    video_id, yt_channel_id, webhook_id, published_at, detected_at, sent_at, status
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                video_id, yt_channel_id, webhook_id,
+                format_utc(published_at), format_utc(detected_at),
+                format_utc(to_utc(sent_at)) if sent_at else None, status
+            ))
+            log_id = cursor.lastrowid
+
+            for key in (yt_channel_id, ALL_CHANNELS):
+                cursor.execute(f"""
+                    INSERT INTO notification_stats_daily (
+                        yt_channel_id, day, sent_count, failed_count,
+                        lag_count, lag_sum_seconds, {bucket_column}
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (yt_channel_id, day) DO UPDATE SET
+                        sent_count = sent_count + excluded.sent_count,
+                        failed_count = failed_count + excluded.failed_count,
+                        lag_count = lag_count + excluded.lag_count,
+                        lag_sum_seconds = lag_sum_seconds + excluded.lag_sum_seconds,
+                        {bucket_column} = {bucket_column} + excluded.{bucket_column}
+                """, (key, day, sent, 1 - sent, sent, lag_seconds * sent, sent))
+
+            conn.commit()
+            return log_id
+
+    @trace_query
+    def get_notification_stats(self, yt_channel_id: str, since_day: str) -> List[NotificationStatsDaily]:
+        """일별 알림 통계 rollup을 조회합니다. (yt_channel_id가 '*'이면 전체 합계)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM notification_stats_daily
+                WHERE yt_channel_id = ? AND day >= ?
+                ORDER BY day
+            """, (yt_channel_id, since_day))
+            return [
+                NotificationStatsDaily(
+                    yt_channel_id=row['yt_channel_id'],
+                    day=row['day'],
+                    sent_count=row['sent_count'],
+                    failed_count=row['failed_count'],
+                    lag_count=row['lag_count'],
+                    lag_sum_seconds=row['lag_sum_seconds'],
+                    lag_buckets=[row[col] for col in LAG_BUCKET_COLUMNS]
+                )
+                for row in cursor.fetchall()
+            ]
+
+    @trace_query
+    def get_notification_log_page(self, before_id: Optional[int] = None, limit: int = 100,
+                                  yt_channel_id: Optional[str] = None) -> List[NotificationLog]:
+        """알림 이력을 최신순으로 페이지 단위 조회합니다.
+
+        Args:
+            before_id: 이 ID 이전 이력부터 조회 (커서)
+            limit: 최대 조회 개수
+            yt_channel_id: 채널 ID 필터
+        """
+        query = "SELECT * FROM notification_log WHERE 1 = 1"
+        params: list = []
+        if before_id is not None:
+            query += " AND id < ?"
+            params.append(before_id)
+        if yt_channel_id:
+            query += " AND yt_channel_id = ?"
+            params.append(yt_channel_id)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [NotificationLog(**dict(row)) for row in cursor.fetchall()]
+
+    @trace_query
+    def prune_notification_history(self, cutoff: datetime) -> int:
+        """보관 기간이 지난 알림 이력과 일별 통계를 삭제합니다.
+
+        Returns:
+            int: 삭제된 이력 수
+        """
+        cutoff = to_utc(cutoff)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM notification_log WHERE detected_at < ?",
+                (format_utc(cutoff),)
+            )
+            deleted = cursor.rowcount
+            cursor.execute(
+                "DELETE FROM notification_stats_daily WHERE day < ?",
+                (cutoff.date().isoformat(),)
+            )
+            conn.commit()
+            return deleted
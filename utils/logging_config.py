@@ -0,0 +1,148 @@
+# utils/logging_config.py
+import atexit
+import json
+import logging
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+# 로그 출력 형식
+FORMAT_JSON = 'json'
+FORMAT_TEXT = 'text'
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# extra로 전달된 필드를 구분하기 위한 LogRecord 기본 속성 목록
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'taskName'}
+
+# 반복 오류 제한 대상을 구분하는 extra 필드
+RATE_LIMIT_KEYS = ('channel_id', 'webhook_id')
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그를 한 줄짜리 JSON으로 출력합니다. extra로 전달된 필드도 함께 기록합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RepeatedErrorFilter(logging.Filter):
+    """같은 채널/웹훅에서 반복되는 경고·오류 로그를 window(초)마다 burst개까지만 통과시킵니다.
+
+    메시지 템플릿(record.msg)과 extra의 channel_id/webhook_id로 대상을 구분하며,
+    window가 지난 뒤 처음 통과하는 로그에 그동안 생략된 개수(suppressed)를 기록합니다.
+    """
+
+    # 이 개수를 넘으면 window가 지난 항목을 정리
+    MAX_KEYS = 10000
+
+    def __init__(self, burst: int, window: float):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self._lock = threading.Lock()
+        # key -> [window 시작 시각, 통과 수, 생략 수]
+        self._state: Dict[tuple, List] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING or self.burst <= 0:
+            return True
+        target = None
+        for attr in RATE_LIMIT_KEYS:
+            target = getattr(record, attr, None)
+            if target is not None:
+                break
+        if target is None:
+            return True
+
+        key = (record.name, record.msg, target)
+        now = record.created
+        with self._lock:
+            state = self._state.get(key)
+            if state is None or now - state[0] >= self.window:
+                if state is not None and state[2]:
+                    record.suppressed = state[2]
+                elif len(self._state) >= self.MAX_KEYS:
+                    self._prune(now)
+                self._state[key] = [now, 1, 0]
+                return True
+            if state[1] < self.burst:
+                state[1] += 1
+                return True
+            state[2] += 1
+            return False
+
+    def _prune(self, now: float):
+        for key in [k for k, s in self._state.items() if now - s[0] >= self.window]:
+            del self._state[key]
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """메시지 포맷을 listener 스레드로 미루는 QueueHandler입니다.
+
+    같은 프로세스 안의 큐만 사용하므로 기본 prepare()처럼 호출 스레드에서
+    메시지를 미리 포맷하지 않고 LogRecord를 그대로 넘깁니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(level: str = 'INFO', fmt: str = FORMAT_JSON,
+                  error_burst: int = 5, error_window: float = 60.0):
+    """루트 로거에 큐 기반 비동기 로깅을 설정합니다.
+
+    로그 호출은 큐에 LogRecord를 넣기만 하고, 포맷과 stdout 출력은
+    별도 listener 스레드에서 처리하므로 이벤트 루프가 I/O로 막히지 않습니다.
+
+    Args:
+        level: 로그 레벨
+        fmt: 출력 형식 (json, text)
+        error_burst: 대상별 반복 경고·오류 로그를 window마다 통과시킬 개수 (0이면 제한 없음)
+        error_window: 반복 오류 제한 window (초)
+    """
+    global _listener
+    stop_logging()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter() if fmt == FORMAT_JSON else logging.Formatter(TEXT_FORMAT))
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RepeatedErrorFilter(error_burst, error_window))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level.upper())
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging():
+    """큐에 남은 로그를 모두 출력하고 listener 스레드를 종료합니다."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,259 @@
+# utils/profiler.py
+import asyncio
+import cProfile
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from utils.time_utils import get_current_utc, format_utc
+
+logger = logging.getLogger(__name__)
+
+DETERMINISTIC = 'deterministic'
+SAMPLING = 'sampling'
+
+
+class _NullStage:
+    """프로파일링이 꺼져 있을 때 사용하는 no-op 컨텍스트입니다."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: 'CycleProfiler', name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler._record_stage(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _StackSampler:
+    """지정한 스레드의 호출 스택을 주기적으로 샘플링해 collapsed stack 형식으로 집계합니다."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+
+class CycleProfiler:
+    """폴링 사이클과 API 핸들러를 필요할 때만 프로파일링합니다.
+
+    - cycles 모드: 다음 N번의 폴링 사이클을 사이클마다 프로파일링
+    - duration 모드: 지정한 시간 동안 이벤트 루프 스레드 전체(API 핸들러 포함)를 프로파일링
+
+    결과(pstats 또는 collapsed stack)와 단계별 소요 시간(JSON)은 output_dir에 저장됩니다.
+    비활성 상태에서 stage()/profile_cycle()은 공유 no-op 객체를 반환합니다.
+    """
+
+    def __init__(self, output_dir: str = 'profiles', sample_interval: float = 0.005):
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval
+        self._lock = threading.Lock()
+        self._mode: Optional[str] = None
+        self._remaining_cycles = 0
+        self._window_handle = None
+        self._window_ends_at: Optional[str] = None
+        self._collecting = False
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[_StackSampler] = None
+        self.last_stage_timings: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def active(self) -> bool:
+        return self._remaining_cycles > 0 or self._window_handle is not None
+
+    def configure(self, output_dir: str, sample_interval: float):
+        """결과 저장 디렉터리와 샘플링 간격을 설정합니다. (애플리케이션 시작 시 Config 값으로 호출)"""
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'active': self.active,
+            'mode': self._mode,
+            'remaining_cycles': self._remaining_cycles,
+            'window_ends_at': self._window_ends_at,
+            'last_stage_timings': self.last_stage_timings,
+        }
+
+    def start(self, mode: str, cycles: Optional[int] = None, duration: Optional[int] = None):
+        """프로파일링을 예약합니다. 이벤트 루프 안에서 호출해야 합니다.
+
+        Args:
+            mode: deterministic(cProfile) 또는 sampling(스택 샘플링)
+            cycles: 프로파일링할 폴링 사이클 수
+            duration: 프로파일링할 시간(초)
+
+        Raises:
+            ValueError: 이미 프로파일링 중이거나 인자가 잘못된 경우
+        """
+        if self.active:
+            raise ValueError("Profiling is already active")
+        if mode not in (DETERMINISTIC, SAMPLING):
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        if (cycles is None) == (duration is None):
+            raise ValueError("Specify exactly one of cycles or duration")
+
+        self._mode = mode
+        if cycles is not None:
+            self._remaining_cycles = cycles
+            logger.info(f"Profiling armed for next {cycles} poll cycles ({mode})")
+            return
+
+        loop = asyncio.get_running_loop()
+        self._begin()
+        self._window_handle = loop.call_later(duration, self._finish_window)
+        self._window_ends_at = format_utc(get_current_utc() + timedelta(seconds=duration))
+        logger.info(f"Profiling started for {duration} seconds ({mode})")
+
+    def stop(self):
+        """진행 중인 프로파일링을 중단하고 수집된 결과를 저장합니다."""
+        self._remaining_cycles = 0
+        if self._window_handle is not None:
+            self._window_handle.cancel()
+            self._finish_window()
+
+    def profile_cycle(self, label: str = 'poll'):
+        """폴링 사이클 하나를 감싸는 컨텍스트를 반환합니다."""
+        if self._remaining_cycles <= 0 or self._collecting:
+            return _NULL_STAGE
+        return _CycleScope(self, label)
+
+    def stage(self, name: str):
+        """단계별 소요 시간을 기록하는 컨텍스트를 반환합니다."""
+        if not self._collecting:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        """저장된 프로파일 파일 목록을 최신순으로 반환합니다."""
+        if not os.path.isdir(self.output_dir):
+            return []
+        files = []
+        for name in os.listdir(self.output_dir):
+            path = os.path.join(self.output_dir, name)
+            if os.path.isfile(path):
+                files.append({
+                    'name': name,
+                    'size': os.path.getsize(path),
+                    'created_at': format_utc(datetime.fromtimestamp(os.path.getmtime(path), timezone.utc))
+                })
+        return sorted(files, key=lambda f: f['name'], reverse=True)
+
+    def get_profile_path(self, name: str) -> Optional[str]:
+        """다운로드할 프로파일 파일 경로를 반환합니다. (output_dir 밖의 경로는 거부)"""
+        if os.path.basename(name) != name:
+            return None
+        path = os.path.join(self.output_dir, name)
+        return path if os.path.isfile(path) else None
+
+    def _begin(self):
+        self._stages = {}
+        self._collecting = True
+        if self._mode == DETERMINISTIC:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = _StackSampler(threading.get_ident(), self.sample_interval)
+            self._sampler.start()
+
+    def _end(self, label: str):
+        self._collecting = False
+        os.makedirs(self.output_dir, exist_ok=True)
+        prefix = os.path.join(
+            self.output_dir,
+            f"{get_current_utc().strftime('%Y%m%dT%H%M%S%f')}-{label}"
+        )
+
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(f"{prefix}.pstats")
+            self._profile = None
+        if self._sampler is not None:
+            stacks = self._sampler.stop()
+            with open(f"{prefix}.collapsed", 'w') as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            self._sampler = None
+
+        with self._lock:
+            self.last_stage_timings = self._stages
+        with open(f"{prefix}-stages.json", 'w') as f:
+            json.dump(self.last_stage_timings, f, indent=2)
+        logger.info(f"Profile saved: {prefix}")
+
+    def _finish_window(self):
+        self._window_handle = None
+        self._window_ends_at = None
+        self._end('window')
+
+    def _record_stage(self, name: str, elapsed: float):
+        with self._lock:
+            stage = self._stages.setdefault(name, {'count': 0, 'total_seconds': 0.0})
+            stage['count'] += 1
+            stage['total_seconds'] += elapsed
+
+
+class _CycleScope:
+    __slots__ = ('profiler', 'label')
+
+    def __init__(self, profiler: CycleProfiler, label: str):
+        self.profiler = profiler
+        self.label = label
+
+    def __enter__(self):
+        self.profiler._begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler._remaining_cycles = max(0, self.profiler._remaining_cycles - 1)
+        self.profiler._end(self.label)
+        return False
+
+
+# 설정은 main에서 Config 값으로 configure()를 호출해 적용
+cycle_profiler = CycleProfiler()
@@ -0,0 +1,100 @@
+# utils/scheduler.py
+import asyncio
+import logging
+import math
+import random
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PollScheduler:
+    """폴링 사이클을 하나의 태스크에서 고정 주기(fixed-rate)로 실행합니다.
+
+    - 다음 실행 시각은 이전 예정 시각 + interval로 계산하므로 사이클 소요 시간만큼 밀리지 않습니다.
+    - 사이클이 interval보다 길어지면 놓친 tick은 건너뛰고, 사이클이 겹쳐 실행되지 않습니다.
+    - 각 사이클에는 deadline(이벤트 루프 시각)이 전달되며, 사이클 함수는 이를 넘기지 않도록
+      남은 작업을 다음 tick으로 넘겨야 합니다.
+    - jitter는 매 tick의 대기 시간에만 더해지며 기준 시각에는 누적되지 않습니다.
+      (interval의 10%를 넘지 않도록 제한)
+    """
+
+    def __init__(self, cycle: Callable[[float], Awaitable[None]], interval: float,
+                 deadline: float, jitter: float = 0.0):
+        self.cycle = cycle
+        self.interval = interval
+        self.deadline = min(deadline, interval)
+        self.jitter = min(jitter, interval * 0.1)
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> bool:
+        """스케줄러를 시작합니다. 이미 실행 중이면 False를 반환합니다."""
+        if self.running:
+            return False
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name='poll-scheduler')
+        return True
+
+    async def stop(self, drain: bool = True, timeout: Optional[float] = None) -> bool:
+        """스케줄러를 중지합니다.
+
+        Args:
+            drain: True면 진행 중인 사이클이 끝날 때까지 기다리고, False면 즉시 취소
+            timeout: drain 대기 최대 시간(초). 초과하면 사이클을 취소
+
+        Returns:
+            bool: 실행 중이던 스케줄러를 중지했으면 True
+        """
+        if not self.running:
+            return False
+
+        task = self._task
+        self._stop_event.set()
+        if not drain:
+            task.cancel()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Poll cycle did not drain within {timeout}s, cancelling")
+            task.cancel()
+        except asyncio.CancelledError:
+            pass
+
+        if not task.done():
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        return True
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        while not self._stop_event.is_set():
+            try:
+                await self.cycle(next_tick + self.deadline)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in poll cycle: {e}", exc_info=True)
+
+            next_tick += self.interval
+            now = loop.time()
+            if next_tick <= now:
+                missed = math.floor((now - next_tick) / self.interval) + 1
+                next_tick += missed * self.interval
+                logger.warning(f"Poll cycle overran its interval, skipping {missed} tick(s)")
+
+            delay = next_tick - now + random.uniform(0, self.jitter)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,72 @@
+# utils/single_flight.py
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class CooldownActive(Exception):
+    """대상의 재실행 대기 시간이 남아 있을 때 발생합니다."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Retry after {retry_after:.0f} seconds")
+        self.retry_after = retry_after
+
+
+class SingleFlight:
+    """대상(key)별로 동시에 하나의 작업만 실행하고, 성공한 뒤 cooldown 동안 재실행을 막습니다.
+
+    같은 대상의 작업이 진행 중이면 새로 실행하지 않고 진행 중인 작업의 결과를 함께 받습니다.
+    작업이 실패하거나 취소되면 cooldown을 적용하지 않아 바로 다시 실행할 수 있습니다.
+    """
+
+    def __init__(self, cooldown: float):
+        self.cooldown = cooldown
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._finished_at: Dict[Hashable, float] = {}
+
+    def retry_after(self, key: Hashable) -> float:
+        """다시 실행할 수 있을 때까지 남은 시간(초)을 반환합니다. (0이면 실행 가능)"""
+        finished_at = self._finished_at.get(key)
+        if finished_at is None:
+            return 0.0
+        remaining = finished_at + self.cooldown - time.monotonic()
+        if remaining <= 0:
+            del self._finished_at[key]
+            return 0.0
+        return remaining
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """작업을 실행하거나 진행 중인 작업에 합류합니다.
+
+        Returns:
+            Tuple[Any, bool]: (작업 결과, 진행 중인 작업에 합류했는지 여부)
+
+        Raises:
+            CooldownActive: 마지막 실행 후 cooldown이 지나지 않은 경우
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            return await asyncio.shield(task), True
+
+        retry_after = self.retry_after(key)
+        if retry_after > 0:
+            raise CooldownActive(retry_after)
+
+        task = asyncio.create_task(func())
+        self._in_flight[key] = task
+        try:
+            # 요청이 끊겨도 합류한 다른 요청을 위해 작업은 계속 실행
+            return await asyncio.shield(task), False
+        finally:
+            if task.done():
+                self._finish(key, task)
+            else:
+                task.add_done_callback(lambda t: self._finish(key, t))
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        # 결과를 받을 요청이 모두 끊긴 경우에도 예외가 처리되지 않은 것으로 경고되지 않도록 함
+        succeeded = not task.cancelled() and task.exception() is None
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            if succeeded:
+                self._finished_at[key] = time.monotonic()
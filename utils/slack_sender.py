@@ -1,16 +1,29 @@
 # utils/slack_sender.py
 import logging
 from slack_sdk.webhook import WebhookClient
-from typing import Dict
+from typing import Dict, Optional
 from utils.db_manager import DatabaseManager
+from utils.circuit_breaker import CircuitBreakerRegistry, WEBHOOK
+from utils.profiler import cycle_profiler
+from utils.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
+# 웹훅이 폐기/삭제된 경우 Slack이 반환하는 상태 코드 (즉시 breaker open)
+PERMANENT_FAILURE_STATUS = (403, 404, 410)
+
+# 알림 전송 결과 (SKIPPED: 웹훅 circuit breaker가 열려 전송하지 않음)
+SENT = 'sent'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+
 class SlackSender:
-    def __init__(self, db: DatabaseManager):
+    def __init__(self, db: DatabaseManager, breakers: Optional[CircuitBreakerRegistry] = None):
         self.db = db
+        self.breakers = breakers
 
-    def send_notification(self, yt_channel_id: str, video: Dict) -> bool:
+    def send_notification(self, yt_channel_id: str, video: Dict) -> str:
         """새로운 동영상 알림을 Slack으로 전송합니다.
 
         Args:
@@ -18,19 +31,34 @@ class SlackSender:
             video: 동영상 정보 {'title': str, 'url': str, 'published_at': str}
 
         Returns:
-            bool: 알림 전송 성공 여부
+            str: 전송 결과 (SENT, FAILED, SKIPPED)
         """
+        with tracer.span('slack.send_notification', channel_id=yt_channel_id) as span:
+            status = self._send_notification(yt_channel_id, video, span)
+            span.set_attribute('status', status)
+            return status
+
+    def _send_notification(self, yt_channel_id: str, video: Dict, span) -> str:
         try:
             # 채널 정보로 웹훅 URL 조회
-            channel = self.db.get_channel_by_yt_channel_id(yt_channel_id)
+            with cycle_profiler.stage('db_read'):
+                channel = self.db.get_channel_by_yt_channel_id(yt_channel_id)
+                webhook = self.db.get_webhook(channel.webhook_id) if channel else None
             if not channel:
-                logger.error(f"Channel not found for ID: {yt_channel_id}")
-                return False
+                logger.error("Channel not found for ID: %s", yt_channel_id, extra={'channel_id': yt_channel_id})
+                return FAILED
 
-            webhook = self.db.get_webhook(channel.webhook_id)
             if not webhook:
-                logger.error(f"Webhook not found for ID: {channel.webhook_id}")
-                return False
+                logger.error("Webhook not found for ID: %s", channel.webhook_id,
+                             extra={'webhook_id': channel.webhook_id})
+                return FAILED
+
+            span.set_attribute('webhook_id', webhook.webhook_id)
+            breaker_key = str(webhook.webhook_id)
+            if self.breakers and not self.breakers.allow(WEBHOOK, breaker_key):
+                logger.debug("Circuit open for webhook %s, skipping notification", webhook.webhook_id,
+                             extra={'webhook_id': webhook.webhook_id})
+                return SKIPPED
 
             # Slack 메시지 생성
             blocks = [
@@ -59,23 +87,44 @@ class SlackSender:
 
             # Slack으로 알림 전송
             webhook_client = WebhookClient(webhook.url)
-            response = webhook_client.send(blocks=blocks)
+            try:
+                with tracer.span('slack.webhook.send', webhook_id=webhook.webhook_id) as send_span, \
+                        cycle_profiler.stage('slack_send'):
+                    response = webhook_client.send(blocks=blocks)
+                    send_span.set_attribute('status_code', response.status_code)
+            except Exception as e:
+                if self.breakers:
+                    self.breakers.record_failure(WEBHOOK, breaker_key, str(e))
+                raise
 
             if response.status_code != 200:
                 logger.error(
-                    f"Failed to send Slack notification: {response.status_code} - "
-                    f"Channel: {channel.yt_ch_name}, Video: {video['title']}"
+                    "Failed to send Slack notification: %s - Channel: %s, Video: %s",
+                    response.status_code, channel.yt_ch_name, video['title'],
+                    extra={'webhook_id': webhook.webhook_id, 'status_code': response.status_code}
                 )
-                return False
+                if self.breakers:
+                    self.breakers.record_failure(
+                        WEBHOOK,
+                        breaker_key,
+                        f"HTTP {response.status_code}: {response.body}",
+                        trip=response.status_code in PERMANENT_FAILURE_STATUS
+                    )
+                return FAILED
+
+            if self.breakers:
+                self.breakers.record_success(WEBHOOK, breaker_key)
 
             logger.info(
-                f"Successfully sent notification for channel '{channel.yt_ch_name}' - "
-                f"Video: {video['title']}"
+                "Successfully sent notification for channel '%s' - Video: %s",
+                channel.yt_ch_name, video['title'],
+                extra={'channel_id': yt_channel_id, 'webhook_id': webhook.webhook_id}
             )
-            return True
+            return SENT
 
         except Exception as e:
             logger.error(
-                f"Error sending Slack notification for channel {yt_channel_id}: {str(e)}"
+                "Error sending Slack notification for channel %s: %s", yt_channel_id, e,
+                extra={'channel_id': yt_channel_id}
             )
-            return False
\ No newline at end of file
+            return FAILED
\ No newline at end of file
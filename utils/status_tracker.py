@@ -0,0 +1,143 @@
+# utils/status_tracker.py
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+from utils.time_utils import get_current_utc, format_utc
+
+logger = logging.getLogger(__name__)
+
+
+class StatusTracker:
+    """백그라운드 작업 상태를 한 곳에서 관리하고 구독자에게 이벤트를 전달합니다.
+
+    상태 API와 이벤트 스트림 모두 이 객체의 메모리 상태만 읽으므로
+    대시보드 조회 시 DB나 YouTube API를 호출하지 않습니다.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: List[asyncio.Queue] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._state: Dict[str, Any] = {
+            'background_task_running': False,
+            'youtube_api_quota_used': 0,
+            'cycle_running': False,
+            'last_cycle_started_at': None,
+            'last_cycle_finished_at': None,
+            'last_cycle_duration': None,
+            'last_cycle_channels': 0,
+            'last_cycle_notifications': 0,
+            'last_cycle_failures': 0,
+            'last_cycle_carried_over': 0,
+            'total_notifications': 0,
+            'total_failures': 0,
+            'circuit_breakers_open': 0,
+            'backfill_running': False,
+        }
+
+    def status(self) -> Dict[str, Any]:
+        """상태 API 응답 형식의 스냅샷을 반환합니다."""
+        return {'status': 'running', **self._state}
+
+    def subscribe(self) -> asyncio.Queue:
+        """이벤트 구독 큐를 등록합니다. 이벤트 루프 안에서 호출해야 합니다."""
+        self._loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def close(self):
+        """모든 구독자에게 종료 신호(None)를 보냅니다."""
+        for queue in list(self._subscribers):
+            self._put(queue, None)
+
+    def update_quota(self, quota_used: int):
+        """quota 사용량이 바뀐 경우에만 quota_changed 이벤트를 발행합니다."""
+        if quota_used != self._state['youtube_api_quota_used']:
+            self.publish('quota_changed', quota_used=quota_used)
+
+    def publish(self, event_type: str, **data):
+        """상태를 갱신하고 구독자에게 이벤트를 전달합니다.
+
+        Args:
+            event_type: background_started, background_stopped, cycle_started,
+                cycle_finished, notification_sent, notification_failed, quota_changed,
+                circuit_breaker_changed, channel_status_changed,
+                backfill_started, backfill_finished
+            data: 이벤트별 추가 정보
+        """
+        self._apply(event_type, data)
+
+        if not self._subscribers:
+            return
+
+        event = {
+            'type': event_type,
+            'timestamp': format_utc(get_current_utc()),
+            'data': data,
+            'status': self.status()
+        }
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if self._loop is not None and running_loop is not self._loop:
+            # 워커 스레드에서 발행된 이벤트는 이벤트 루프로 넘겨서 전달
+            self._loop.call_soon_threadsafe(self._broadcast, event)
+        else:
+            self._broadcast(event)
+
+    def _apply(self, event_type: str, data: Dict[str, Any]):
+        state = self._state
+        if event_type == 'background_started':
+            state['background_task_running'] = True
+        elif event_type == 'background_stopped':
+            state['background_task_running'] = False
+        elif event_type == 'cycle_started':
+            state['cycle_running'] = True
+            state['last_cycle_started_at'] = format_utc(get_current_utc())
+            state['last_cycle_channels'] = data.get('channels', 0)
+            state['last_cycle_notifications'] = 0
+            state['last_cycle_failures'] = 0
+        elif event_type == 'cycle_finished':
+            state['cycle_running'] = False
+            state['last_cycle_finished_at'] = format_utc(get_current_utc())
+            state['last_cycle_duration'] = data.get('duration')
+            state['last_cycle_carried_over'] = data.get('carried_over', 0)
+        elif event_type == 'notification_sent':
+            state['last_cycle_notifications'] += 1
+            state['total_notifications'] += 1
+        elif event_type == 'notification_failed':
+            state['last_cycle_failures'] += 1
+            state['total_failures'] += 1
+        elif event_type == 'quota_changed':
+            state['youtube_api_quota_used'] = data['quota_used']
+        elif event_type == 'backfill_started':
+            state['backfill_running'] = True
+        elif event_type == 'backfill_finished':
+            state['backfill_running'] = False
+        elif event_type == 'circuit_breaker_changed':
+            state['circuit_breakers_open'] = data['open_count']
+
+    def _broadcast(self, event: Dict[str, Any]):
+        for queue in list(self._subscribers):
+            self._put(queue, event)
+
+    def _put(self, queue: asyncio.Queue, item):
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # 느린 구독자는 가장 오래된 이벤트를 버림 (매 이벤트에 전체 상태가 포함됨)
+            try:
+                queue.get_nowait()
+                queue.put_nowait(item)
+            except (asyncio.QueueEmpty, asyncio.QueueFull):
+                logger.warning("Dropping status event for slow subscriber")
+
+
+status_tracker = StatusTracker()
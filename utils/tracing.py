@@ -0,0 +1,295 @@
+# utils/tracing.py
+import contextvars
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from functools import wraps
+from typing import Any, Dict, List, Optional
+import requests
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = 'youtube-slack'
+
+# 내보내기 방식
+EXPORTER_NONE = 'none'
+EXPORTER_JSONL = 'jsonl'
+EXPORTER_OTLP = 'otlp'
+
+
+class Span:
+    """하나의 작업 구간을 나타냅니다."""
+    __slots__ = ('tracer', 'name', 'trace_id', 'span_id', 'parent_span_id',
+                 'start_ns', 'end_ns', 'attributes', 'error', '_token')
+
+    recording = True
+
+    def __init__(self, tracer: 'Tracer', name: str, trace_id: str,
+                 parent_span_id: Optional[str], attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = attributes
+        self.error = None
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException):
+        self.error = f"{type(error).__name__}: {error}"
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None and self.error is None:
+            self.record_error(exc)
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        self.tracer._export(self)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_span_id': self.parent_span_id,
+            'name': self.name,
+            'start_time_unix_nano': self.start_ns,
+            'end_time_unix_nano': self.end_ns,
+            'duration_ms': (self.end_ns - self.start_ns) / 1e6,
+            'attributes': self.attributes,
+            'status': 'error' if self.error else 'ok',
+            'error': self.error,
+        }
+
+
+class _NonRecordingSpan:
+    """샘플링에서 제외된 trace의 root span입니다.
+
+    샘플링되지 않은 trace의 하위 span도 기록되지 않도록 컨텍스트에는 남겨 둡니다.
+    """
+    __slots__ = ('_token',)
+
+    recording = False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def record_error(self, error: BaseException):
+        pass
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        return False
+
+
+class _NoopSpan:
+    """tracing이 꺼져 있을 때 반환하는 공유 객체입니다."""
+    __slots__ = ()
+
+    recording = False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def record_error(self, error: BaseException):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+_current_span: contextvars.ContextVar = contextvars.ContextVar('current_span', default=None)
+
+
+class Tracer:
+    """폴링 사이클 → YouTube 조회 → Slack 전송 → DB 쿼리로 이어지는 span을 기록합니다.
+
+    span은 백그라운드 스레드에서 일정 개수씩 묶어 JSONL 파일이나
+    OTLP/HTTP(JSON) 호환 collector로 내보냅니다.
+    """
+
+    def __init__(self, exporter: str = EXPORTER_NONE, sample_ratio: float = 1.0,
+                 jsonl_path: str = 'traces.jsonl', otlp_endpoint: str = '',
+                 batch_size: int = 256, flush_interval: float = 5.0):
+        self.exporter = exporter
+        self.enabled = exporter != EXPORTER_NONE
+        self.sample_ratio = sample_ratio
+        self.jsonl_path = jsonl_path
+        self.otlp_endpoint = otlp_endpoint
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=10000)
+        self._worker: Optional[threading.Thread] = None
+        if self.enabled:
+            self._start_worker()
+
+    def configure(self, exporter: str, sample_ratio: float, jsonl_path: str, otlp_endpoint: str):
+        """내보내기 설정을 적용합니다. (애플리케이션 시작 시 Config 값으로 호출)"""
+        self.shutdown()
+        self.exporter = exporter
+        self.enabled = exporter != EXPORTER_NONE
+        self.sample_ratio = sample_ratio
+        self.jsonl_path = jsonl_path
+        self.otlp_endpoint = otlp_endpoint
+        if self.enabled:
+            self._start_worker()
+
+    def _start_worker(self):
+        self._worker = threading.Thread(target=self._run, name='trace-exporter', daemon=True)
+        self._worker.start()
+
+    def span(self, name: str, require_parent: bool = False, **attributes):
+        """span 컨텍스트를 반환합니다.
+
+        Args:
+            name: span 이름
+            require_parent: True면 진행 중인 trace가 있을 때만 기록 (DB 쿼리 등)
+            attributes: span 속성 (channel_id, webhook_id, quota_cost 등)
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+
+        parent = _current_span.get()
+        if parent is None:
+            if require_parent:
+                return _NOOP_SPAN
+            if random.random() >= self.sample_ratio:
+                return _NonRecordingSpan()
+            return Span(self, name, f"{random.getrandbits(128):032x}", None, attributes)
+        if not parent.recording:
+            return _NOOP_SPAN
+        return Span(self, name, parent.trace_id, parent.span_id, attributes)
+
+    def shutdown(self, timeout: float = 5.0):
+        """남은 span을 내보내고 exporter 스레드를 종료합니다."""
+        if self._worker is None:
+            return
+        self._queue.put(None)
+        self._worker.join(timeout)
+        self._worker = None
+
+    def _export(self, span: Span):
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            logger.warning("Trace export queue is full, dropping span")
+
+    def _run(self):
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                span = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                span = False
+
+            if span is None:
+                self._flush(batch)
+                return
+            if span:
+                batch.append(span)
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, batch: List[Span]):
+        if not batch:
+            return
+        try:
+            if self.exporter == EXPORTER_JSONL:
+                with open(self.jsonl_path, 'a') as f:
+                    for span in batch:
+                        f.write(json.dumps(span.to_dict(), default=str) + '\n')
+            elif self.exporter == EXPORTER_OTLP:
+                response = requests.post(
+                    self.otlp_endpoint,
+                    json=_to_otlp(batch),
+                    timeout=10
+                )
+                if response.status_code >= 400:
+                    logger.warning(f"OTLP export failed: {response.status_code} - {response.text[:200]}")
+        except Exception as e:
+            logger.warning(f"Failed to export {len(batch)} spans: {e}")
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _to_otlp(batch: List[Span]) -> Dict[str, Any]:
+    """span 목록을 OTLP/HTTP JSON 형식으로 변환합니다."""
+    spans = []
+    for span in batch:
+        otlp_span = {
+            'traceId': span.trace_id,
+            'spanId': span.span_id,
+            'name': span.name,
+            'kind': 1,
+            'startTimeUnixNano': str(span.start_ns),
+            'endTimeUnixNano': str(span.end_ns),
+            'attributes': [
+                {'key': key, 'value': _otlp_value(value)}
+                for key, value in span.attributes.items()
+            ],
+            'status': {'code': 2, 'message': span.error} if span.error else {'code': 1},
+        }
+        if span.parent_span_id:
+            otlp_span['parentSpanId'] = span.parent_span_id
+        spans.append(otlp_span)
+
+    return {
+        'resourceSpans': [{
+            'resource': {
+                'attributes': [{'key': 'service.name', 'value': {'stringValue': SERVICE_NAME}}]
+            },
+            'scopeSpans': [{'scope': {'name': 'youtube_slack'}, 'spans': spans}]
+        }]
+    }
+
+
+def trace_call(name: str, require_parent: bool = False):
+    """함수 호출 전체를 하나의 span으로 기록하는 데코레이터입니다."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(name, require_parent=require_parent):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def trace_query(func):
+    """DatabaseManager 메서드를 진행 중인 trace의 하위 span으로 기록합니다."""
+    return trace_call(f"db.{func.__name__}", require_parent=True)(func)
+
+
+# 설정은 main에서 Config 값으로 configure()를 호출해 적용 (기본값은 비활성)
+tracer = Tracer()
@@ -1,25 +1,99 @@
 # utils/youtube_api.py
+import contextvars
+import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from functools import wraps
 from datetime import datetime
+import httplib2
 from googleapiclient.discovery import build
-from typing import Dict, List, Optional
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
+from utils.profiler import cycle_profiler
+from utils.tracing import tracer, trace_call
+
+if TYPE_CHECKING:
+    from utils.circuit_breaker import CircuitBreakerRegistry
 
 logger = logging.getLogger(__name__)
 
+# channels.list 한 번에 조회 가능한 최대 채널 ID 수
+CHANNELS_PER_REQUEST = 50
+
+# playlistItems.list 한 페이지 최대 항목 수
+PLAYLIST_PAGE_SIZE = 50
+
+# 채널 하나가 아니라 API 전체가 실패하는 오류 reason (quota/요청 제한)
+GLOBAL_ERROR_REASONS = {'quotaExceeded', 'dailyLimitExceeded', 'rateLimitExceeded', 'userRateLimitExceeded'}
+
+# 채널(업로드 플레이리스트)이 더 이상 존재하지 않는 오류 reason
+CHANNEL_GONE_REASONS = {'playlistNotFound', 'channelNotFound'}
+
+
+# 응답을 받지 못한 전송 계층 오류 (연결 실패, 타임아웃 등)
+TRANSPORT_ERRORS = (OSError, TimeoutError, httplib2.HttpLib2Error)
+
+
+class YouTubeUnavailableError(Exception):
+    """quota 소진, 요청 제한, 네트워크 오류 등으로 채널과 무관하게 API 호출이 실패한 경우 발생합니다."""
+
+
+@dataclass
+class ChannelCheckResult:
+    """채널 배치 조회 결과
+
+    breaker가 열려 건너뛰었거나 일시적인 오류로 결과를 얻지 못한 채널은 checked와 missing 어디에도 포함되지 않습니다.
+    """
+    videos: Dict[str, List[Dict]] = field(default_factory=dict)  # 채널 ID별 새 동영상 목록
+    checked: Set[str] = field(default_factory=set)  # 조회에 성공한 채널
+    missing: Set[str] = field(default_factory=set)  # channels.list에서 누락되었거나 404가 반환된 채널
+
+
+def _error_reasons(error: HttpError) -> Set[str]:
+    # error_details는 응답 형식에 따라 비어 있거나 errors 대신 details 목록이 들어가므로 본문을 직접 파싱
+    try:
+        body = json.loads(error.content)
+        details = body['error'].get('errors', []) + body['error'].get('details', [])
+    except (ValueError, TypeError, KeyError, AttributeError):
+        details = error.error_details if isinstance(error.error_details, list) else []
+    return {d.get('reason') for d in details if isinstance(d, dict)}
+
+
+def is_channel_gone_error(error: Exception) -> bool:
+    """채널이 삭제/정지되어 발생한 오류인지 반환합니다."""
+    return isinstance(error, HttpError) and (
+        error.status_code == 404 or bool(_error_reasons(error) & CHANNEL_GONE_REASONS)
+    )
+
+
+def is_global_error(error: Exception) -> bool:
+    """quota/요청 제한 또는 HTTP 응답을 받지 못한 네트워크 오류인지 반환합니다.
+
+    그 밖의 오류(응답 파싱 실패 등)는 해당 채널만의 오류로 처리합니다.
+    """
+    if isinstance(error, HttpError):
+        return error.status_code == 429 or bool(_error_reasons(error) & GLOBAL_ERROR_REASONS)
+    return isinstance(error, TRANSPORT_ERRORS)
+
 
 def log_api_call(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            logger.info(f"YouTube API call: {func.__name__} - Duration: {duration}s")
+            logger.info(
+                "YouTube API call: %s - Duration: %.3fs",
+                func.__name__, time.perf_counter() - start_time,
+                extra={'api_call': func.__name__}
+            )
             return result
         except Exception as e:
-            logger.error(f"YouTube API error in {func.__name__}: {str(e)}")
+            logger.error("YouTube API error in %s: %s", func.__name__, e, extra={'api_call': func.__name__})
             raise
 
     return wrapper
@@ -31,6 +105,9 @@ class YouTubeAPI:
     def __init__(self):
         self.youtube = None
         self._daily_quota_used = 0
+        self._quota_lock = threading.Lock()
+        # httplib2.Http는 스레드 안전하지 않으므로 스레드마다 별도로 생성
+        self._thread_local = threading.local()
 
     @classmethod
     def initialize(cls, api_key: str):
@@ -63,28 +140,28 @@ class YouTubeAPI:
 
             # 이미 채널 ID인 경우
             if clean_handling_id.startswith('UC'):
-                self._daily_quota_used += 1
+                self._use_quota(1)
                 response = self.youtube.channels().list(
                     id=clean_handling_id,
                     part='snippet'
-                ).execute()
+                ).execute(http=self._get_thread_http())
             else:
                 # username으로 시도 (quota: 1)
-                self._daily_quota_used += 1
+                self._use_quota(1)
                 response = self.youtube.channels().list(
                     forUsername=clean_handling_id,
                     part='id,snippet'
-                ).execute()
+                ).execute(http=self._get_thread_http())
 
                 # 실패 시 검색 시도 (quota: 100)
                 if not response.get('items'):
-                    self._daily_quota_used += 100
+                    self._use_quota(100)
                     response = self.youtube.search().list(
                         q=handling_id,
                         type='channel',
                         part='snippet',
                         maxResults=1
-                    ).execute()
+                    ).execute(http=self._get_thread_http())
 
             if not response.get('items'):
                 raise ValueError(f"Channel not found for handling ID: {handling_id}")
@@ -102,71 +179,256 @@ class YouTubeAPI:
     # utils/youtube_api.py
 
     @log_api_call
-    def check_new_videos_batch(self, channels: List[dict], last_check_time: datetime) -> Dict[str, List[Dict]]:
+    @trace_call('youtube.check_new_videos_batch')
+    def check_new_videos_batch(self, since_by_channel: Dict[str, datetime], max_pages: int,
+                               breakers: Optional['CircuitBreakerRegistry'] = None) -> ChannelCheckResult:
         """여러 채널의 새 동영상을 확인합니다.
 
+        채널마다 마지막 확인 시간(전송에 성공한 마지막 동영상의 게시 시간) 이후의 동영상을 조회하므로,
+        Slack 장애 등으로 전송하지 못한 동영상은 장애가 길어져도 다음 사이클에서 다시 조회됩니다.
+
         Args:
-            channels: [{'yt_channel_id': str, 'yt_ch_name': str}, ...]
-            last_check_time: 마지막 확인 시간
+            since_by_channel: YouTube 채널 ID별 마지막 확인 시간
+            max_pages: 채널당 최대 조회 페이지 수 (quota: 페이지당 1)
+            breakers: 채널별 circuit breaker (open 상태인 채널은 건너뜀)
 
         Returns:
-            Dict[str, List[Dict]]: 채널 ID별 새 동영상 목록
+            ChannelCheckResult: 채널 ID별 새 동영상 목록과 채널별 조회 결과
+
+        Raises:
+            YouTubeUnavailableError: quota 소진 등으로 조회를 계속할 수 없는 경우
         """
+        result = ChannelCheckResult()
         try:
-            # 1. 모든 채널 ID로 한 번에 플레이리스트 ID 조회 (quota: 1)
-            channel_ids = [ch['yt_channel_id'] for ch in channels]
-            channel_response = self.youtube.channels().list(
-                id=','.join(channel_ids),
-                part='contentDetails',
-                maxResults=50
-            ).execute()
-
-            # 채널별 플레이리스트 ID 매핑
-            playlist_mapping = {}
-            for item in channel_response.get('items', []):
-                channel_id = item['id']
-                playlist_id = item['contentDetails']['relatedPlaylists']['uploads']
-                playlist_mapping[channel_id] = playlist_id
-
-            # 2. 각 플레이리스트의 최근 동영상 개별 조회
-            new_videos_by_channel = {}
-
+            # 1. 채널 ID 50개 단위로 플레이리스트 ID 조회 (quota: 1 per request)
+            channel_ids = list(since_by_channel)
+            if breakers:
+                channel_ids = [cid for cid in channel_ids if breakers.allow('channel', cid)]
+            if not channel_ids:
+                return result
+
+            playlist_mapping = self.get_upload_playlists(channel_ids)
+            for channel_id in channel_ids:
+                if channel_id not in playlist_mapping:
+                    self._mark_missing(result, channel_id, breakers)
+
+            # 2. 각 플레이리스트에서 마지막 확인 시간 이후 동영상 조회 (대부분 1페이지에서 끝남)
             for channel_id, playlist_id in playlist_mapping.items():
                 try:
-                    # 플레이리스트 항목 조회 (quota: 1 per request)
-                    playlist_response = self.youtube.playlistItems().list(
-                        playlistId=playlist_id,
-                        part='snippet',
-                        maxResults=5
-                    ).execute()
-
-                    # 새 동영상 필터링
-                    new_videos = []
-                    for item in playlist_response.get('items', []):
-                        published_at = datetime.fromisoformat(
-                            item['snippet']['publishedAt'].replace('Z', '+00:00')
+                    with tracer.span('youtube.poll_channel', channel_id=channel_id) as span:
+                        new_videos = self.fetch_uploads_since(
+                            playlist_id, since_by_channel[channel_id], max_pages
                         )
-
-                        if published_at > last_check_time:
-                            new_videos.append({
-                                'video_id': item['snippet']['resourceId']['videoId'],
-                                'title': item['snippet']['title'],
-                                'published_at': published_at
-                            })
+                        span.set_attribute('videos', len(new_videos))
 
                     if new_videos:
-                        new_videos_by_channel[channel_id] = new_videos
+                        result.videos[channel_id] = new_videos
+                    result.checked.add(channel_id)
+                    if breakers:
+                        breakers.record_success('channel', channel_id)
 
                 except Exception as e:
-                    logger.error(f"Error checking videos for channel {channel_id}: {e}")
+                    # quota 소진 등은 남은 채널도 모두 실패하므로 배치를 중단 (채널 상태는 변경하지 않음)
+                    if is_global_error(e):
+                        raise YouTubeUnavailableError(str(e)) from e
+                    logger.error("Error checking videos for channel %s: %s", channel_id, e,
+                                 extra={'channel_id': channel_id})
+                    # 404 등은 누락으로 세고, 그 밖의 오류(5xx, 접근 불가 등)는 실패를 기록해 반복되면 breaker가 열리도록 함
+                    if is_channel_gone_error(e):
+                        self._mark_missing(result, channel_id, breakers)
+                    elif breakers:
+                        breakers.record_failure('channel', channel_id, str(e))
                     continue
 
-            return new_videos_by_channel
+            return result
 
+        except YouTubeUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Error checking new videos in batch: {e}")
             raise ValueError(f"Failed to check new videos: {str(e)}")
 
+    def get_upload_playlists(self, channel_ids: List[str]) -> Dict[str, str]:
+        """채널 ID 목록을 업로드 플레이리스트 ID로 변환합니다. (quota: 50개당 1)
+
+        응답에 포함되지 않은 채널(삭제/정지 등)은 결과에서 빠집니다.
+
+        Returns:
+            Dict[str, str]: 채널 ID별 업로드 플레이리스트 ID
+        """
+        playlist_mapping = {}
+        for i in range(0, len(channel_ids), CHANNELS_PER_REQUEST):
+            chunk = channel_ids[i:i + CHANNELS_PER_REQUEST]
+            self._use_quota(1)
+            with tracer.span('youtube.channels.list', channels=len(chunk), quota_cost=1) as span, \
+                    cycle_profiler.stage('playlist_resolution'):
+                channel_response = self.youtube.channels().list(
+                    id=','.join(chunk),
+                    part='contentDetails',
+                    maxResults=CHANNELS_PER_REQUEST
+                ).execute(http=self._get_thread_http())
+                span.set_attribute('items', len(channel_response.get('items', [])))
+
+            for item in channel_response.get('items', []):
+                channel_id = item['id']
+                playlist_id = item['contentDetails']['relatedPlaylists']['uploads']
+                playlist_mapping[channel_id] = playlist_id
+
+        return playlist_mapping
+
+    @staticmethod
+    def _mark_missing(result: ChannelCheckResult, channel_id: str,
+                      breakers: Optional['CircuitBreakerRegistry']):
+        """삭제/정지된 채널을 누락으로 기록합니다.
+
+        누락된 채널은 breaker로 건너뛰지 않고 매 사이클 확인해 휴면 전환 기준(연속 누락 횟수)을 채우도록
+        breaker 상태를 초기화합니다. (breaker는 일시적인 채널 오류에만 사용)
+        """
+        result.missing.add(channel_id)
+        if breakers:
+            breakers.reset('channel', channel_id)
+
+    def fetch_uploads_since(self, playlist_id: str, since: datetime, max_pages: int) -> List[Dict]:
+        """업로드 플레이리스트를 페이지 단위로 따라가며 since 이후 동영상을 조회합니다.
+
+        업로드 플레이리스트는 최신순이므로 since 이전 항목을 만나면 즉시 중단합니다.
+        여러 스레드에서 동시에 호출할 수 있습니다.
+
+        Args:
+            playlist_id: 업로드 플레이리스트 ID
+            since: 이 시각 이후에 게시된 동영상만 반환
+            max_pages: 최대 조회 페이지 수 (quota: 페이지당 1)
+
+        Returns:
+            List[Dict]: [{'video_id': str, 'title': str, 'published_at': datetime}, ...]
+        """
+        videos = []
+        page_token = None
+        for page in range(max_pages):
+            self._use_quota(1)
+            with tracer.span('youtube.playlistItems.list', playlist_id=playlist_id,
+                             page=page, quota_cost=1), \
+                    cycle_profiler.stage('playlist_fetch'):
+                response = self.youtube.playlistItems().list(
+                    playlistId=playlist_id,
+                    part='snippet',
+                    maxResults=PLAYLIST_PAGE_SIZE,
+                    pageToken=page_token
+                ).execute(http=self._get_thread_http())
+
+            for item in response.get('items', []):
+                video = self._parse_playlist_item(item)
+                if video['published_at'] <= since:
+                    return videos
+                videos.append(video)
+
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+        else:
+            logger.warning(
+                f"Backfill for playlist {playlist_id} stopped after {max_pages} pages "
+                f"before reaching {since.isoformat()}"
+            )
+        return videos
+
+    @log_api_call
+    @trace_call('youtube.backfill_new_videos')
+    def backfill_new_videos(self, channels: List[dict], max_pages: int, max_workers: int,
+                            breakers: Optional['CircuitBreakerRegistry'] = None) -> ChannelCheckResult:
+        """채널별 마지막 확인 시각 이후의 모든 동영상을 조회합니다. (다운타임 복구용)
+
+        Args:
+            channels: [{'yt_channel_id': str, 'since': datetime}, ...]
+            max_pages: 채널당 최대 조회 페이지 수
+            max_workers: 동시에 조회할 채널 수
+            breakers: 채널별 circuit breaker (open 상태인 채널은 건너뜀)
+
+        Returns:
+            ChannelCheckResult: 채널 ID별 누락된 동영상 목록과 채널별 조회 결과
+
+        Raises:
+            YouTubeUnavailableError: quota 소진 등으로 조회를 계속할 수 없는 경우
+        """
+        since_by_channel = {ch['yt_channel_id']: ch['since'] for ch in channels}
+        channel_ids = list(since_by_channel)
+        if breakers:
+            channel_ids = [cid for cid in channel_ids if breakers.allow('channel', cid)]
+        result = ChannelCheckResult()
+        if not channel_ids:
+            return result
+
+        try:
+            playlist_mapping = self.get_upload_playlists(channel_ids)
+        except Exception as e:
+            logger.error(f"Error resolving upload playlists for backfill: {e}")
+            raise YouTubeUnavailableError(f"Failed to backfill videos: {str(e)}") from e
+        for channel_id in channel_ids:
+            if channel_id not in playlist_mapping:
+                self._mark_missing(result, channel_id, breakers)
+
+        def fetch(channel_id: str):
+            try:
+                with tracer.span('youtube.backfill_channel', channel_id=channel_id) as span:
+                    videos = self.fetch_uploads_since(
+                        playlist_mapping[channel_id], since_by_channel[channel_id], max_pages
+                    )
+                    span.set_attribute('videos', len(videos))
+                if breakers:
+                    breakers.record_success('channel', channel_id)
+                return channel_id, videos, True
+            except Exception as e:
+                if is_global_error(e):
+                    raise YouTubeUnavailableError(str(e)) from e
+                logger.error("Error backfilling videos for channel %s: %s", channel_id, e,
+                             extra={'channel_id': channel_id})
+                if is_channel_gone_error(e):
+                    return channel_id, [], False
+                if breakers:
+                    breakers.record_failure('channel', channel_id, str(e))
+                return channel_id, [], None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # 작업 스레드에서도 현재 trace를 이어가도록 컨텍스트를 복사해서 실행
+            context = contextvars.copy_context()
+            # found: True(조회 성공), False(채널 없음), None(일시적 오류로 결과 없음)
+            try:
+                for channel_id, videos, found in executor.map(
+                    lambda cid: context.copy().run(fetch, cid), playlist_mapping
+                ):
+                    if videos:
+                        result.videos[channel_id] = videos
+                    if found:
+                        result.checked.add(channel_id)
+                    elif found is False:
+                        self._mark_missing(result, channel_id, breakers)
+            except YouTubeUnavailableError:
+                executor.shutdown(cancel_futures=True)
+                raise
+        return result
+
+    @staticmethod
+    def _parse_playlist_item(item: Dict) -> Dict:
+        return {
+            'video_id': item['snippet']['resourceId']['videoId'],
+            'title': item['snippet']['title'],
+            'published_at': datetime.fromisoformat(
+                item['snippet']['publishedAt'].replace('Z', '+00:00')
+            )
+        }
+
+    def _get_thread_http(self) -> httplib2.Http:
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            # discovery 기본 클라이언트와 같은 타임아웃(60초)을 사용
+            http = build_http()
+            self._thread_local.http = http
+        return http
+
+    def _use_quota(self, units: int):
+        with self._quota_lock:
+            self._daily_quota_used += units
+
     def get_daily_quota_used(self) -> int:
         """하루 동안 사용된 quota를 반환합니다."""
         return self._daily_quota_used
\ No newline at end of file